@@ -16,9 +16,68 @@ from imp.context.summarizer import summarize_project
 from imp.context.summary_cache import load_summaries, save_summaries
 
 if TYPE_CHECKING:
+    from imp.context.models import ProjectScan
     from imp.context.summarizer import InvokeFn
 
 
+def _run_init(
+    root: Path,
+    invoke_fn: InvokeFn | None = None,
+    model: str | None = None,
+) -> tuple[ProjectScan, list[Path], Path, int, int]:
+    """Run the init pipeline without validation or output.
+
+    Steps 3-6 of init_command: scan, optional summarization, indexes and cache.
+
+    Args:
+        root: Project root directory (must exist)
+        invoke_fn: Async callable for AI invocation; None skips summarization
+        model: AI model name recorded with the summaries
+
+    Returns:
+        Tuple of (scan, index_files, cache_file, summarized_count, summary_tokens)
+    """
+    # 3. Scan + parse (L1+L2)
+    scan_result = scan_and_parse(root)
+
+    # 4. Optionally run L3 summarization
+    summarized_count = 0
+    summary_tokens = 0
+    if invoke_fn is not None:
+        # Load cached summaries
+        cached = load_summaries(root)
+
+        # Invalidate stale summaries — re-summarize modules whose files changed
+        previous = load_previous_scan(root)
+        if previous is not None:
+            stale = detect_stale_modules(scan_result, previous)
+            for s in stale:
+                cached.pop(s.module_path, None)
+
+        # Run summarization
+        scan_result, summaries, usage = asyncio.run(
+            summarize_project(
+                scan_result,
+                invoke_fn,
+                cached_summaries=cached,
+                model_name=model or "unknown",
+            )
+        )
+        summarized_count = len(summaries)
+        summary_tokens = usage.total_tokens
+
+        # Save summaries cache
+        save_summaries(summaries, root)
+
+    # 5. Generate .index.md files
+    index_files = generate_indexes(scan_result, root)
+
+    # 6. Save cache to .imp/
+    cache_file = save_cache(scan_result, root)
+
+    return scan_result, index_files, cache_file, summarized_count, summary_tokens
+
+
 def init_command(
     root: Path,
     format: str = "human",
@@ -68,43 +127,10 @@ def init_command(
         return 1
 
     try:
-        # 3. Scan + parse (L1+L2)
-        scan_result = scan_and_parse(root)
-
-        # 4. Optionally run L3 summarization
-        summarized_count = 0
-        summary_tokens = 0
-        if summarize and invoke_fn is not None:
-            # Load cached summaries
-            cached = load_summaries(root)
-
-            # Invalidate stale summaries — re-summarize modules whose files changed
-            previous = load_previous_scan(root)
-            if previous is not None:
-                stale = detect_stale_modules(scan_result, previous)
-                for s in stale:
-                    cached.pop(s.module_path, None)
-
-            # Run summarization
-            scan_result, summaries, usage = asyncio.run(
-                summarize_project(
-                    scan_result,
-                    invoke_fn,
-                    cached_summaries=cached,
-                    model_name=model or "unknown",
-                )
-            )
-            summarized_count = len(summaries)
-            summary_tokens = usage.total_tokens
-
-            # Save summaries cache
-            save_summaries(summaries, root)
-
-        # 5. Generate .index.md files
-        index_files = generate_indexes(scan_result, root)
-
-        # 6. Save cache to .imp/
-        cache_file = save_cache(scan_result, root)
+        # 3-6. Scan, summarize, index, cache
+        scan_result, index_files, cache_file, summarized_count, summary_tokens = _run_init(
+            root, invoke_fn if summarize else None, model
+        )
 
         # 7. Output summary in requested format
         if format == "json":
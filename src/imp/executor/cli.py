@@ -7,9 +7,11 @@ import json
 import subprocess
 from pathlib import Path
 
+from pydantic import ValidationError
+
 from imp.executor.context import ContextGenerator
 from imp.executor.logger import DecisionLogger
-from imp.executor.models import SessionStatus, WorktreeSession
+from imp.executor.models import SessionListEntry, SessionStatus, WorktreeSession
 from imp.executor.pipeline import CompletionPipeline
 from imp.executor.session import SessionStore
 from imp.executor.worktree import WorktreeManager
@@ -28,10 +30,9 @@ def start_command(
         base_branch: Branch to base the worktree on. If None, auto-detects
             the current branch.
 
-    Returns 0 on success, 1 on error or if session already active.
+    Returns 0 on success, 1 on error, invalid ticket_id, or if session already active.
     """
     root = project_root if project_root is not None else Path.cwd()
-    store = SessionStore(root)
     worktree_mgr = WorktreeManager(root)
     ctx_gen = ContextGenerator(root)
 
@@ -39,24 +40,30 @@ def start_command(
     if base_branch is None:
         base_branch = worktree_mgr.current_branch()
 
-    # Check for existing active session
-    existing = store.load(ticket_id)
-    if existing is not None and existing.status == SessionStatus.active:
-        return 1
-
-    # Create worktree
-    try:
-        worktree_path = worktree_mgr.create(ticket_id, base_branch=base_branch)
-    except Exception:
-        return 1
-
-    # Create and persist session
-    session = WorktreeSession(
-        ticket_id=ticket_id,
-        title=title,
-        description=description,
-    )
-    store.save(session)
+    with SessionStore(root) as store:
+        # Check for existing active session
+        existing = store.load(ticket_id)
+        if existing is not None and existing.status == SessionStatus.active:
+            return 1
+
+        # Build the session first so an unsafe ticket_id never reaches git
+        try:
+            session = WorktreeSession(
+                ticket_id=ticket_id,
+                title=title,
+                description=description,
+            )
+        except ValidationError:
+            return 1
+
+        # Create worktree
+        try:
+            worktree_path = worktree_mgr.create(ticket_id, base_branch=base_branch)
+        except Exception:
+            return 1
+
+        # Persist session
+        store.save(session)
 
     # Sync all extras so optional deps (plane-sdk, claude-agent-sdk, etc.) are
     # available for imp check / imp review inside the worktree (best-effort).
@@ -84,30 +91,30 @@ def done_command(ticket_id: str, project_root: Path | None = None) -> int:
     Returns 1 if no session found.
     """
     root = project_root if project_root is not None else Path.cwd()
-    store = SessionStore(root)
     pipeline = CompletionPipeline(root)
     logger = DecisionLogger(root)
 
-    session = store.load(ticket_id)
-    if session is None:
-        return 1
-
-    result = pipeline.run(session)
-
-    # Log the decision
-    worktree_path = root / session.worktree_path
-    outcome = "done" if result.passed else ("escalated" if result.escalated else "failed")
-    logger.log_completion(
-        ticket_id=ticket_id,
-        attempts=result.attempts,
-        outcome=outcome,
-        worktree_path=worktree_path,
-    )
+    with SessionStore(root) as store:
+        session = store.load(ticket_id)
+        if session is None:
+            return 1
+
+        result = pipeline.run(session)
+
+        # Log the decision
+        worktree_path = root / session.worktree_path
+        outcome = "done" if result.passed else ("escalated" if result.escalated else "failed")
+        logger.log_completion(
+            ticket_id=ticket_id,
+            attempts=result.attempts,
+            outcome=outcome,
+            worktree_path=worktree_path,
+        )
 
-    # Persist updated session status
-    store.save(session)
+        # Persist updated session status
+        store.save(session)
 
-    return result.exit_code
+        return result.exit_code
 
 
 def list_command(project_root: Path | None = None, format: str = "human") -> int:
@@ -116,19 +123,12 @@ def list_command(project_root: Path | None = None, format: str = "human") -> int
     Returns 0 always.
     """
     root = project_root if project_root is not None else Path.cwd()
-    store = SessionStore(root)
-
-    sessions = store.list_sessions()
+    with SessionStore(root) as store:
+        sessions = store.list_sessions()
 
     if format == "json":
         data = [
-            {
-                "ticket_id": s.ticket_id,
-                "title": s.title,
-                "status": s.status,
-                "branch": s.branch,
-                "attempt_count": s.attempt_count,
-            }
+            SessionListEntry.from_session(s).model_dump(mode="json", exclude={"created_at"})
             for s in sessions
         ]
         print(json.dumps(data))
@@ -149,16 +149,16 @@ def clean_command(force: bool = False, project_root: Path | None = None) -> int:
     Returns 0 always.
     """
     root = project_root if project_root is not None else Path.cwd()
-    store = SessionStore(root)
     worktree_mgr = WorktreeManager(root)
 
-    sessions = store.list_sessions()
+    with SessionStore(root) as store:
+        sessions = store.list_sessions()
 
-    for session in sessions:
-        should_clean = force or session.status != SessionStatus.active
-        if should_clean:
-            with contextlib.suppress(Exception):
-                worktree_mgr.remove(session.ticket_id)
-            store.delete(session.ticket_id)
+        for session in sessions:
+            should_clean = force or session.status != SessionStatus.active
+            if should_clean:
+                with contextlib.suppress(Exception):
+                    worktree_mgr.remove(session.ticket_id)
+                store.delete(session.ticket_id)
 
-    return 0
+        return 0
@@ -2,46 +2,46 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from imp.executor.models import WorktreeSession
-
-
-class ContextGenerator:
-    """Generates TASK.md context files for managed executor sessions."""
-
-    def __init__(self, project_root: Path) -> None:
-        self._project_root = project_root
-
-    def generate(self, session: WorktreeSession, scan_data: dict[str, Any] | None = None) -> str:
-        """Generate TASK.md content for the given session."""
-        budget = session.context_budget
-        used = budget.used_tokens
-        max_t = budget.max_tokens
-
-        if scan_data is not None:
-            modules = scan_data.get("modules", [])
-            module_lines = "\n".join(f"- `{m['name']}` → `{m['path']}`" for m in modules)
-            structure_body = (
-                f"Scanned modules:\n{module_lines}\n\n"
-                "See `.index.md` in each package directory for detailed navigation."
-            )
-        else:
-            structure_body = (
-                "Run `imp init` to generate the index, then read `.index.md` "
-                "for codebase navigation."
-            )
-
-        content = f"""\
-# TASK: {session.ticket_id} — {session.title}
+from imp.executor.models import ContextBudget, WorktreeSession
+
+
+@lru_cache(maxsize=256)
+def _render(
+    ticket_id: str,
+    title: str,
+    description: str,
+    branch: str,
+    budget: ContextBudget,
+    modules: tuple[tuple[str, str], ...] | None,
+) -> str:
+    """Render TASK.md; a pure function of its (hashable) arguments, so it is memoized."""
+    used = budget.used_tokens
+    max_t = budget.max_tokens
+
+    if modules is not None:
+        module_lines = "\n".join(f"- `{name}` → `{path}`" for name, path in modules)
+        structure_body = (
+            f"Scanned modules:\n{module_lines}\n\n"
+            "See `.index.md` in each package directory for detailed navigation."
+        )
+    else:
+        structure_body = (
+            "Run `imp init` to generate the index, then read `.index.md` for codebase navigation."
+        )
+
+    content = f"""\
+# TASK: {ticket_id} — {title}
 
 ## Goal
 
-**Ticket:** {session.ticket_id}
-**Title:** {session.title}
+**Ticket:** {ticket_id}
+**Title:** {title}
 
-{session.description}
+{description}
 
 ## Project Structure
 
@@ -62,7 +62,7 @@ class ContextGenerator:
 - Source: `src/imp/`
 - Tests: `tests/`
 - Index: `.index.md` in each package directory
-- Session data: `.imp/sessions/`
+- Session data: `.imp/sessions.db`
 - Plans: `.imp/plans/`
 - Summaries: `.imp/summaries.json`
 
@@ -71,7 +71,7 @@ class ContextGenerator:
 When the ticket is complete:
 1. All `imp check` gates pass (tests, lint, type, format).
 2. `imp review` returns no blocking issues.
-3. Code is committed on branch `{session.branch}`.
+3. Code is committed on branch `{branch}`.
 4. No changes outside the ticket scope.
 
 ## Context Budget
@@ -82,7 +82,28 @@ When the ticket is complete:
 
 Keep responses focused and avoid loading unnecessary files to preserve context budget.
 """
-        return content
+    return content
+
+
+class ContextGenerator:
+    """Generates TASK.md context files for managed executor sessions."""
+
+    def __init__(self, project_root: Path) -> None:
+        self._project_root = project_root
+
+    def generate(self, session: WorktreeSession, scan_data: dict[str, Any] | None = None) -> str:
+        """Generate TASK.md content for the given session."""
+        modules = None
+        if scan_data is not None:
+            modules = tuple((m["name"], m["path"]) for m in scan_data.get("modules", []))
+        return _render(
+            session.ticket_id,
+            session.title,
+            session.description,
+            session.branch,
+            session.context_budget,
+            modules,
+        )
 
     def write_task_file(self, worktree_path: Path, content: str) -> Path:
         """Write TASK.md to the worktree directory. Returns the path."""
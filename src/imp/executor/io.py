@@ -0,0 +1,17 @@
+"""Byte-level JSON file I/O for executor models."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from pydantic import BaseModel
+
+
+def write_model(path: Path, model: BaseModel, *, indent: int | None = 2) -> None:
+    """Write model as JSON, passing pydantic-core's UTF-8 bytes straight to the file."""
+    path.write_bytes(model.__pydantic_serializer__.to_json(model, indent=indent))
+
+
+def read_model[ModelT: BaseModel](cls: type[ModelT], path: Path) -> ModelT:
+    """Validate a model from the raw bytes of a JSON file, without decoding to str."""
+    return cls.model_validate_json(path.read_bytes())
@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
-from datetime import UTC, datetime
 from pathlib import Path
 
+from imp.executor.io import read_model, write_model
 from imp.executor.models import CompletionAttempt, DecisionEntry
 
+_OUTPUT_FIELDS = ("check", "review")
+
 
 class DecisionLogger:
-    """Logs completion decisions to .imp/decisions/{ticket_id}.json."""
+    """Logs completion decisions to .imp/decisions/{ticket_id}.json.
+
+    Attempt check/review output can run to hundreds of KB, so it is written to
+    sidecar files under .imp/decisions/{ticket_id}/attempts/ and left out of the
+    JSON. load() and list_decisions() read them back unless called with lazy=True.
+    Decision JSON is compact unless pretty=True.
+    """
 
-    def __init__(self, project_root: Path) -> None:
+    def __init__(self, project_root: Path, *, pretty: bool = False) -> None:
         self.project_root = project_root
         self.decisions_dir = project_root / ".imp" / "decisions"
+        self.pretty = pretty
 
     def log_completion(
         self,
@@ -30,17 +40,63 @@ class DecisionLogger:
 
         entry = DecisionEntry(
             ticket_id=ticket_id,
-            timestamp=datetime.now(UTC),
-            files_changed=files_changed,
+            files_changed=tuple(files_changed),
             diff_summary=diff_summary,
-            attempt_history=attempts,
+            attempt_history=tuple(attempts),
             outcome=outcome,
         )
 
+        stored = entry.model_copy(
+            update={"attempt_history": tuple(self._write_outputs(ticket_id, attempts))}
+        )
         path = self.decisions_dir / f"{ticket_id}.json"
-        path.write_text(entry.model_dump_json(indent=2), encoding="utf-8")
+        write_model(path, stored, indent=2 if self.pretty else None)
         return entry
 
+    def _attempts_dir(self, ticket_id: str) -> Path:
+        return self.decisions_dir / ticket_id / "attempts"
+
+    def _write_outputs(
+        self, ticket_id: str, attempts: list[CompletionAttempt]
+    ) -> list[CompletionAttempt]:
+        """Write non-empty attempt outputs to sidecars; return the attempts without them.
+
+        Sidecars from an earlier log of the same ticket are removed first, so an
+        attempt whose output is now empty does not resolve to the old output.
+        """
+        attempts_dir = self._attempts_dir(ticket_id)
+        for stale in attempts_dir.glob("*.log"):
+            stale.unlink()
+        stripped: list[CompletionAttempt] = []
+        for attempt in attempts:
+            for kind in _OUTPUT_FIELDS:
+                output: str = getattr(attempt, f"{kind}_output")
+                if output:
+                    attempts_dir.mkdir(parents=True, exist_ok=True)
+                    sidecar = attempts_dir / f"{attempt.attempt_number}.{kind}.log"
+                    sidecar.write_text(output, encoding="utf-8")
+            stripped.append(attempt.model_copy(update={"check_output": "", "review_output": ""}))
+        return stripped
+
+    def resolve_outputs(self, entry: DecisionEntry) -> DecisionEntry:
+        """Return the entry with attempt outputs read back from their sidecar files.
+
+        Attempts without sidecars keep the output stored in the JSON, so entries
+        logged before outputs moved out of the JSON resolve unchanged.
+        """
+        attempts_dir = self._attempts_dir(entry.ticket_id)
+        if not attempts_dir.is_dir():
+            return entry
+        resolved: list[CompletionAttempt] = []
+        for attempt in entry.attempt_history:
+            update: dict[str, str] = {}
+            for kind in _OUTPUT_FIELDS:
+                sidecar = attempts_dir / f"{attempt.attempt_number}.{kind}.log"
+                if sidecar.is_file():
+                    update[f"{kind}_output"] = sidecar.read_text(encoding="utf-8")
+            resolved.append(attempt.model_copy(update=update))
+        return entry.model_copy(update={"attempt_history": tuple(resolved)})
+
     def _get_diff_info(self, worktree_path: Path) -> tuple[list[str], str]:
         """Run git diff --stat HEAD and parse output."""
         result = subprocess.run(
@@ -63,20 +119,28 @@ class DecisionLogger:
 
         return files, output
 
-    def load(self, ticket_id: str) -> DecisionEntry | None:
-        """Load a decision entry by ticket_id, or None if not found."""
+    def load(self, ticket_id: str, *, lazy: bool = False) -> DecisionEntry | None:
+        """Load a decision entry by ticket_id, or None if not found.
+
+        With lazy=True attempt outputs are left empty; call resolve_outputs()
+        later to read them.
+        """
         path = self.decisions_dir / f"{ticket_id}.json"
         if not path.exists():
             return None
-        return DecisionEntry.model_validate_json(path.read_text(encoding="utf-8"))
+        entry = read_model(DecisionEntry, path)
+        return entry if lazy else self.resolve_outputs(entry)
 
-    def list_decisions(self) -> list[DecisionEntry]:
-        """Return all logged decision entries."""
-        if not self.decisions_dir.exists():
+    def list_decisions(self, *, lazy: bool = False) -> list[DecisionEntry]:
+        """Return all logged decision entries; lazy=True leaves attempt outputs empty."""
+        try:
+            dir_entries = os.scandir(self.decisions_dir)
+        except FileNotFoundError:
             return []
-        entries: list[DecisionEntry] = []
-        for json_file in self.decisions_dir.glob("*.json"):
-            entries.append(
-                DecisionEntry.model_validate_json(json_file.read_text(encoding="utf-8"))
-            )
-        return entries
+        with dir_entries:
+            entries = [
+                read_model(DecisionEntry, Path(dir_entry.path))
+                for dir_entry in dir_entries
+                if dir_entry.name.endswith(".json") and dir_entry.is_file()
+            ]
+        return entries if lazy else [self.resolve_outputs(entry) for entry in entries]
@@ -2,11 +2,39 @@
 
 from __future__ import annotations
 
+import re
+import sys
 from datetime import UTC, datetime
 from enum import StrEnum
-from typing import Any
+from functools import lru_cache
 
-from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    computed_field,
+    field_validator,
+)
+
+# Ticket ids become branch names, directory names and file names, so they are
+# limited to alphanumeric runs joined by single '.', '_' or '-' characters.
+_TICKET_ID_RE = re.compile(r"[A-Za-z0-9]+(?:[._-][A-Za-z0-9]+)*")
+
+
+@lru_cache(maxsize=1024)
+def ticket_paths(ticket_id: str) -> tuple[str, str]:
+    """Return the git branch and worktree directory for a ticket.
+
+    The branch is ``imp/{ticket_id}`` and the worktree path, relative to the
+    project root, is ``.trees/{ticket_id}``. Results are interned and cached,
+    so sessions and the worktree manager share the same strings.
+    """
+    return sys.intern(f"imp/{ticket_id}"), sys.intern(f".trees/{ticket_id}")
+
+
+def _utcnow() -> datetime:
+    """Current UTC time; the shared default factory for executor timestamps."""
+    return datetime.now(UTC)
 
 
 class SessionStatus(StrEnum):
@@ -38,9 +66,14 @@ class ContextBudget(BaseModel):
 
 
 class WorktreeSession(BaseModel):
-    """A managed executor session for a single ticket."""
+    """A managed executor session for a single ticket.
 
-    model_config = ConfigDict(frozen=False)
+    ``branch`` and ``worktree_path`` are derived from ``ticket_id`` through a
+    shared cache, so every session for a ticket reuses the same strings. They
+    are serialized as computed fields; stored copies are ignored on load.
+    """
+
+    model_config = ConfigDict(frozen=False, extra="ignore")
 
     ticket_id: str
     title: str
@@ -48,26 +81,28 @@ class WorktreeSession(BaseModel):
     status: SessionStatus = SessionStatus.active
     attempt_count: int = 0
     max_attempts: int = 3
-    created_at: datetime = None  # type: ignore[assignment]
-    context_budget: ContextBudget = None  # type: ignore[assignment]
-    branch: str = ""
-    worktree_path: str = ""
+    created_at: datetime = Field(default_factory=_utcnow)
+    context_budget: ContextBudget = Field(default_factory=ContextBudget)
 
-    @model_validator(mode="before")
+    @field_validator("ticket_id")
     @classmethod
-    def _set_defaults(cls, values: Any) -> Any:
-        """Auto-compute branch, worktree_path, created_at, and context_budget."""
-        if isinstance(values, dict):  # pragma: no branch
-            ticket_id = values.get("ticket_id", "")
-            if not values.get("branch"):
-                values["branch"] = f"imp/{ticket_id}"
-            if not values.get("worktree_path"):
-                values["worktree_path"] = f".trees/{ticket_id}"
-            if values.get("created_at") is None:
-                values["created_at"] = datetime.now(UTC)
-            if values.get("context_budget") is None:
-                values["context_budget"] = ContextBudget()
-        return values
+    def _check_ticket_id(cls, value: str) -> str:
+        """Reject ticket ids that are unsafe as git branch or path components."""
+        if _TICKET_ID_RE.fullmatch(value) is None:
+            raise ValueError(f"invalid ticket_id {value!r}: expected e.g. 'IMP-001'")
+        return value
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def branch(self) -> str:
+        """Git branch for this session: imp/{ticket_id}."""
+        return ticket_paths(self.ticket_id)[0]
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def worktree_path(self) -> str:
+        """Worktree directory relative to the project root: .trees/{ticket_id}."""
+        return ticket_paths(self.ticket_id)[1]
 
 
 class CompletionAttempt(BaseModel):
@@ -80,7 +115,7 @@ class CompletionAttempt(BaseModel):
     check_output: str = ""
     review_passed: bool | None = None
     review_output: str = ""
-    timestamp: datetime
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class CompletionResult(BaseModel):
@@ -112,17 +147,17 @@ class DecisionEntry(BaseModel):
     model_config = ConfigDict(frozen=True)
 
     ticket_id: str
-    timestamp: datetime
-    files_changed: list[str]
+    timestamp: datetime = Field(default_factory=_utcnow)
+    files_changed: tuple[str, ...] = ()
     diff_summary: str
-    attempt_history: list[CompletionAttempt]
+    attempt_history: tuple[CompletionAttempt, ...] = ()
     outcome: str
 
 
 class SessionListEntry(BaseModel):
     """A summary entry for listing active sessions."""
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     ticket_id: str
     title: str
@@ -131,12 +166,27 @@ class SessionListEntry(BaseModel):
     attempt_count: int
     created_at: datetime
 
+    @classmethod
+    def from_session(cls, session: WorktreeSession) -> SessionListEntry:
+        """Summarize an already-validated session without re-running validation.
+
+        Construct entries directly for untrusted input so they are validated.
+        """
+        return cls.model_construct(
+            ticket_id=session.ticket_id,
+            title=session.title,
+            status=session.status,
+            branch=session.branch,
+            attempt_count=session.attempt_count,
+            created_at=session.created_at,
+        )
+
 
 class CleanResult(BaseModel):
     """Result of cleaning up sessions and worktrees."""
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-    removed_sessions: list[str]
-    skipped_sessions: list[str]
-    pruned_branches: list[str]
+    removed_sessions: tuple[str, ...] = ()
+    skipped_sessions: tuple[str, ...] = ()
+    pruned_branches: tuple[str, ...] = ()
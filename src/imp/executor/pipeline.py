@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import os
 import subprocess
-from datetime import UTC, datetime
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from imp.executor.models import (
     CompletionAttempt,
@@ -14,6 +15,17 @@ from imp.executor.models import (
     WorktreeSession,
 )
 
+if TYPE_CHECKING:
+    from imp.pm.base import PMAdapter
+    from imp.pm.models import PlaneConfig
+
+
+def _import_plane_adapter() -> Callable[[PlaneConfig], PMAdapter]:
+    """Import PlaneAdapter on first PM update (plane-sdk is optional)."""
+    from imp.pm.plane import PlaneAdapter
+
+    return PlaneAdapter
+
 
 class CompletionPipeline:
     """Runs the completion pipeline for a managed executor session.
@@ -23,6 +35,9 @@ class CompletionPipeline:
     Success → commit + PM update → exit_code=0.
     """
 
+    # PM adapter factory; None means import PlaneAdapter lazily on first use.
+    _plane_adapter_cls: Callable[[PlaneConfig], PMAdapter] | None = None
+
     def __init__(self, project_root: Path) -> None:
         self.project_root = project_root
         self.max_retries = 3
@@ -38,7 +53,6 @@ class CompletionPipeline:
                 attempt_number=i + 1,
                 check_passed=check_passed,
                 check_output=check_output,
-                timestamp=datetime.now(UTC),
             )
 
             if check_passed:
@@ -165,8 +179,9 @@ class CompletionPipeline:
             return False
 
         try:
-            from imp.pm.models import PlaneConfig  # lazy: plane-sdk is optional
-            from imp.pm.plane import PlaneAdapter
+            from imp.pm.models import PlaneConfig  # lazy: imp.pm stays off the import path
+
+            adapter_cls = self._plane_adapter_cls or _import_plane_adapter()
 
             workspace = os.environ.get("PLANE_WORKSPACE_SLUG", "")
             project = os.environ.get("PLANE_PROJECT_ID", "")
@@ -177,7 +192,7 @@ class CompletionPipeline:
                 project_id=project,
                 base_url=base_url,
             )
-            adapter = PlaneAdapter(config)
+            adapter = adapter_cls(config)
             status = "done" if result.passed else "escalated"
             message = f"imp code done: ticket={ticket_id} status={status}"
             adapter.add_comment(ticket_id, message)
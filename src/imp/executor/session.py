@@ -1,54 +1,176 @@
-"""SessionStore — JSON-backed persistence for WorktreeSession objects."""
+"""SessionStore — SQLite-backed persistence for WorktreeSession objects."""
 
 from __future__ import annotations
 
-import json
+import logging
+import sqlite3
+from collections.abc import Iterable
 from pathlib import Path
+from types import TracebackType
+
+from pydantic import ValidationError
 
 from imp.executor.models import WorktreeSession
 
+logger = logging.getLogger(__name__)
+
+_UPSERT_SQL = """INSERT INTO sessions (ticket_id, payload) VALUES (?, ?)
+    ON CONFLICT(ticket_id) DO UPDATE SET payload = excluded.payload"""
+_IMPORT_SQL = "INSERT OR IGNORE INTO sessions (ticket_id, payload) VALUES (?, ?)"
+
+# Stored in PRAGMA user_version; databases below it still need the legacy import.
+_SCHEMA_VERSION = 1
+
 
 class SessionStore:
-    """Stores and retrieves WorktreeSession objects as JSON files."""
+    """Stores and retrieves WorktreeSession objects in .imp/sessions.db.
+
+    One row per ticket_id holding the session JSON, so listing is a single query
+    instead of one file read per session. The database is opened on first use and
+    created by save(); reads on a fresh project touch nothing. Sessions that earlier
+    versions wrote as .imp/sessions/{ticket_id}.json are imported once, the first time
+    the database is opened.
+    """
 
     def __init__(self, project_root: Path) -> None:
-        self._sessions_dir = project_root / ".imp" / "sessions"
+        self._db_path = project_root / ".imp" / "sessions.db"
+        self._legacy_dir = project_root / ".imp" / "sessions"
+        self._conn: sqlite3.Connection | None = None
+
+    def _open(self) -> sqlite3.Connection:
+        """Return the connection, creating the database and schema on first use."""
+        if self._conn is not None:
+            return self._conn
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self._db_path))
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    ticket_id TEXT PRIMARY KEY NOT NULL,
+                    payload TEXT NOT NULL
+                )
+            """)
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            if version < _SCHEMA_VERSION:
+                self._import_legacy(conn)
+        except BaseException:
+            conn.close()
+            raise
+        self._conn = conn
+        return conn
+
+    def _open_existing(self) -> sqlite3.Connection | None:
+        """Return the connection, or None if there are no sessions to read yet.
+
+        A project with only legacy JSON sessions is migrated on its first read.
+        """
+        if self._conn is None and not self._db_path.exists() and not self._legacy_dir.is_dir():
+            return None
+        return self._open()
+
+    def _import_legacy(self, conn: sqlite3.Connection) -> None:
+        """Import sessions saved as per-ticket JSON files by earlier versions.
 
-    def _session_path(self, ticket_id: str) -> Path:
-        return self._sessions_dir / f"{ticket_id}.json"
+        The rows and the user_version bump commit together, so an interrupted
+        import is retried by the next store. Files that no longer validate are
+        skipped with a warning naming each one and left on disk; sessions
+        already in the database win.
+        """
+        rows: list[tuple[str, str]] = []
+        if self._legacy_dir.is_dir():
+            for json_file in sorted(self._legacy_dir.glob("*.json")):
+                try:
+                    session = WorktreeSession.model_validate_json(json_file.read_bytes())
+                except ValidationError as exc:
+                    logger.warning(
+                        "Skipped legacy session %s: %d validation error(s); the file is kept",
+                        json_file,
+                        exc.error_count(),
+                    )
+                    continue
+                rows.append((session.ticket_id, session.model_dump_json()))
+        with conn:
+            conn.execute("BEGIN")
+            conn.executemany(_IMPORT_SQL, rows)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, sessions: Iterable[WorktreeSession]) -> None:
+        """Write sessions in one transaction; payloads are serialized before it opens."""
+        rows = [(session.ticket_id, session.model_dump_json()) for session in sessions]
+        with conn:
+            conn.executemany(_UPSERT_SQL, rows)
 
     def save(self, session: WorktreeSession) -> None:
-        """Persist a session to disk, creating the directory if needed."""
-        self._sessions_dir.mkdir(parents=True, exist_ok=True)
-        path = self._session_path(session.ticket_id)
-        path.write_text(session.model_dump_json(), encoding="utf-8")
+        """Persist a session, creating the database if needed."""
+        self._upsert(self._open(), (session,))
+
+    def save_many(self, sessions: Iterable[WorktreeSession]) -> None:
+        """Persist several sessions in a single transaction, creating the database if needed."""
+        self._upsert(self._open(), sessions)
 
     def load(self, ticket_id: str) -> WorktreeSession | None:
         """Load a session by ticket_id, or None if not found."""
-        path = self._session_path(ticket_id)
-        if not path.exists():
+        conn = self._open_existing()
+        if conn is None:
+            return None
+        row = conn.execute(
+            "SELECT payload FROM sessions WHERE ticket_id = ?", (ticket_id,)
+        ).fetchone()
+        if row is None:
             return None
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return WorktreeSession.model_validate(data)
+        return WorktreeSession.model_validate_json(row[0])
 
     def list_sessions(self) -> list[WorktreeSession]:
-        """Return all saved sessions."""
-        if not self._sessions_dir.exists():
+        """Return all saved sessions, oldest first."""
+        conn = self._open_existing()
+        if conn is None:
+            return []
+        cursor = conn.execute("SELECT payload FROM sessions ORDER BY rowid")
+        return [WorktreeSession.model_validate_json(payload) for (payload,) in cursor]
+
+    def list_ticket_ids(self) -> list[str]:
+        """Return the ticket_id of every saved session, oldest first, without loading them."""
+        conn = self._open_existing()
+        if conn is None:
             return []
-        sessions = []
-        for json_file in self._sessions_dir.glob("*.json"):
-            data = json.loads(json_file.read_text(encoding="utf-8"))
-            sessions.append(WorktreeSession.model_validate(data))
-        return sessions
+        return [
+            ticket_id
+            for (ticket_id,) in conn.execute("SELECT ticket_id FROM sessions ORDER BY rowid")
+        ]
 
     def delete(self, ticket_id: str) -> bool:
         """Delete a session. Returns True if it existed, False otherwise."""
-        path = self._session_path(ticket_id)
-        if not path.exists():
+        conn = self._open_existing()
+        if conn is None:
             return False
-        path.unlink()
-        return True
+        with conn:
+            cursor = conn.execute("DELETE FROM sessions WHERE ticket_id = ?", (ticket_id,))
+        return cursor.rowcount > 0
 
     def exists(self, ticket_id: str) -> bool:
         """Return True if a session with the given ticket_id exists."""
-        return self._session_path(ticket_id).exists()
+        conn = self._open_existing()
+        if conn is None:
+            return False
+        row = conn.execute("SELECT 1 FROM sessions WHERE ticket_id = ?", (ticket_id,)).fetchone()
+        return row is not None
+
+    def close(self) -> None:
+        """Close the database connection, if one was opened."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> SessionStore:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
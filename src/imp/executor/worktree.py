@@ -5,6 +5,8 @@ from __future__ import annotations
 import subprocess
 from pathlib import Path
 
+from imp.executor.models import ticket_paths
+
 
 class WorktreeError(Exception):
     """Raised when a git worktree operation fails."""
@@ -47,8 +49,7 @@ class WorktreeManager:
 
     def create(self, ticket_id: str, base_branch: str = "main") -> Path:
         """Create a new worktree for the ticket. Returns the worktree path."""
-        worktree_path = f".trees/{ticket_id}"
-        branch = f"imp/{ticket_id}"
+        branch, worktree_path = ticket_paths(ticket_id)
         cmd = ["git", "worktree", "add", "-b", branch, worktree_path, base_branch]
         result = self._run(cmd)
         if result.returncode != 0:
@@ -57,7 +58,7 @@ class WorktreeManager:
 
     def remove(self, ticket_id: str) -> None:
         """Remove the worktree for the given ticket."""
-        worktree_path = f".trees/{ticket_id}"
+        worktree_path = ticket_paths(ticket_id)[1]
         cmd = ["git", "worktree", "remove", worktree_path]
         result = self._run(cmd)
         if result.returncode != 0:
@@ -89,7 +90,7 @@ class WorktreeManager:
 
     def exists(self, ticket_id: str) -> bool:
         """Return True if a worktree for the ticket exists."""
-        worktree_path = f".trees/{ticket_id}"
+        worktree_path = ticket_paths(ticket_id)[1]
         trees = self.list_worktrees()
         return any(worktree_path in t.get("worktree", "") for t in trees)
 
@@ -102,7 +103,7 @@ class WorktreeManager:
 
     def delete_branch(self, ticket_id: str, force: bool = False) -> None:
         """Delete the branch for the given ticket."""
-        branch = f"imp/{ticket_id}"
+        branch = ticket_paths(ticket_id)[0]
         flag = "-D" if force else "-d"
         cmd = ["git", "branch", flag, branch]
         result = self._run(cmd)
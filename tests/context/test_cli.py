@@ -146,6 +146,24 @@ def test_init_command_creates_cache(tmp_path: Path) -> None:
     assert isinstance(cache_data, dict)
 
 
+def test_run_init_returns_results_without_output(
+    tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """Test that _run_init returns the scan and artifact paths and prints nothing."""
+    from imp.context.cli import _run_init
+
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "module.py").write_text("def foo(): pass")
+
+    scan, index_files, cache_file, summarized_count, summary_tokens = _run_init(tmp_path)
+
+    assert scan.total_files == 1
+    assert tmp_path / ".index.md" in index_files
+    assert cache_file == tmp_path / ".imp" / "scan.json"
+    assert (summarized_count, summary_tokens) == (0, 0)
+    assert capsys.readouterr().out == ""
+
+
 def test_init_command_missing_root_json_format(capsys: pytest.CaptureFixture) -> None:
     """Test init_command with non-existent root and JSON format."""
     from imp.context.cli import init_command
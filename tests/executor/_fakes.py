@@ -0,0 +1,40 @@
+"""Fake subprocess helpers shared by executor tests."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Any
+
+# Project root that is never created: subprocess.run is faked, so the code under
+# test only joins paths under it and any accidental filesystem access fails loudly.
+FAKE_ROOT = Path("/nonexistent/imp-project")
+
+
+def completed_process(
+    returncode: int = 0, stdout: str = "", stderr: str = ""
+) -> subprocess.CompletedProcess[str]:
+    """Fake subprocess result with the given exit code and output."""
+    return subprocess.CompletedProcess(
+        args=[], returncode=returncode, stdout=stdout, stderr=stderr
+    )
+
+
+class FakeRun:
+    """Stand-in for subprocess.run: records calls and replays queued outcomes.
+
+    Queued exceptions are raised; once the queue is empty every call returns a
+    successful, output-free result.
+    """
+
+    def __init__(self) -> None:
+        self.default = completed_process()
+        self.queue: list[subprocess.CompletedProcess[str] | BaseException] = []
+        self.calls: list[tuple[list[str], dict[str, Any]]] = []
+
+    def __call__(self, cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        self.calls.append((cmd, kwargs))
+        outcome = self.queue.pop(0) if self.queue else self.default
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
@@ -0,0 +1,28 @@
+"""Shared fixtures for executor tests that fake out subprocess calls."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from tests.executor._fakes import FAKE_ROOT, FakeRun
+
+
+@pytest.fixture
+def fake_root() -> Path:
+    """Project root for tests; no temp directory is made per test."""
+    return FAKE_ROOT
+
+
+@pytest.fixture
+def fake_run(monkeypatch: pytest.MonkeyPatch) -> FakeRun:
+    """Replace subprocess.run so no real command is spawned.
+
+    Modules that never run real commands opt in for every test with
+    ``pytestmark = pytest.mark.usefixtures("fake_run")``.
+    """
+    fake = FakeRun()
+    monkeypatch.setattr(subprocess, "run", fake)
+    return fake
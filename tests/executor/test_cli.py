@@ -25,6 +25,13 @@ def _make_session(
     return session
 
 
+def _mock_store() -> MagicMock:
+    """Mock SessionStore whose ``with`` block yields the mock itself."""
+    store = MagicMock()
+    store.__enter__.return_value = store
+    return store
+
+
 def _make_completion_result(
     ticket_id: str = "IMP-1",
     passed: bool = True,
@@ -50,7 +57,7 @@ class TestStartCommand:
 
     def test_creates_session_worktree_and_task_md(self, tmp_path: Path) -> None:
         """start_command creates session, worktree, and TASK.md."""
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.load.return_value = None  # No existing session
         mock_worktree_mgr = MagicMock()
         mock_worktree_mgr.create.return_value = tmp_path / ".trees" / "IMP-1"
@@ -73,7 +80,7 @@ class TestStartCommand:
 
     def test_syncs_all_extras_after_worktree_creation(self, tmp_path: Path) -> None:
         """start_command runs uv sync --all-extras in the worktree after creation."""
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.load.return_value = None
         mock_worktree_mgr = MagicMock()
         worktree_path = tmp_path / ".trees" / "IMP-1s"
@@ -98,7 +105,7 @@ class TestStartCommand:
 
     def test_returns_0_on_success(self, tmp_path: Path) -> None:
         """start_command returns exit code 0 on success."""
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.load.return_value = None
         mock_worktree_mgr = MagicMock()
         mock_worktree_mgr.create.return_value = tmp_path / ".trees" / "IMP-2"
@@ -119,7 +126,7 @@ class TestStartCommand:
 
     def test_returns_1_if_worktree_creation_fails(self, tmp_path: Path) -> None:
         """start_command returns exit code 1 when worktree creation fails."""
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.load.return_value = None
         mock_worktree_mgr = MagicMock()
         mock_worktree_mgr.create.side_effect = RuntimeError("git error")
@@ -138,10 +145,32 @@ class TestStartCommand:
 
         assert result == 1
 
+    def test_returns_1_for_invalid_ticket_id(self, tmp_path: Path) -> None:
+        """start_command rejects unsafe ticket ids before touching git."""
+        mock_store = _mock_store()
+        mock_store.load.return_value = None
+        mock_worktree_mgr = MagicMock()
+
+        with (
+            patch("imp.executor.cli.SessionStore", return_value=mock_store),
+            patch("imp.executor.cli.WorktreeManager", return_value=mock_worktree_mgr),
+            patch("imp.executor.cli.ContextGenerator"),
+        ):
+            result = start_command(
+                ticket_id="../escape",
+                title="Bad ticket",
+                base_branch="main",
+                project_root=tmp_path,
+            )
+
+        assert result == 1
+        mock_worktree_mgr.create.assert_not_called()
+        mock_store.save.assert_not_called()
+
     def test_returns_1_if_session_already_active(self, tmp_path: Path) -> None:
         """start_command returns 1 if an active session for the ticket already exists."""
         existing_session = _make_session("IMP-4", status=SessionStatus.active)
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.load.return_value = existing_session
         mock_worktree_mgr = MagicMock()
         mock_ctx_gen = MagicMock()
@@ -162,7 +191,7 @@ class TestStartCommand:
 
     def test_auto_detects_current_branch_when_none(self, tmp_path: Path) -> None:
         """start_command auto-detects current branch when base_branch is None."""
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.load.return_value = None
         mock_worktree_mgr = MagicMock()
         mock_worktree_mgr.create.return_value = tmp_path / ".trees" / "IMP-5"
@@ -187,7 +216,7 @@ class TestStartCommand:
 
     def test_skips_auto_detect_when_base_branch_provided(self, tmp_path: Path) -> None:
         """start_command does not auto-detect when base_branch is explicit."""
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.load.return_value = None
         mock_worktree_mgr = MagicMock()
         mock_worktree_mgr.create.return_value = tmp_path / ".trees" / "IMP-5b"
@@ -211,7 +240,7 @@ class TestStartCommand:
 
     def test_uses_cwd_as_project_root_when_none(self) -> None:
         """start_command uses cwd as project_root when not provided."""
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.load.return_value = None
         mock_worktree_mgr = MagicMock()
         mock_worktree_mgr.create.return_value = Path("/tmp/.trees/IMP-6")
@@ -233,7 +262,7 @@ class TestStartCommand:
 
     def test_uses_custom_base_branch(self, tmp_path: Path) -> None:
         """start_command passes custom base_branch to WorktreeManager."""
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.load.return_value = None
         mock_worktree_mgr = MagicMock()
         mock_worktree_mgr.create.return_value = tmp_path / ".trees" / "IMP-7"
@@ -270,7 +299,7 @@ class TestDoneCommand:
     def test_returns_0_when_pipeline_passes(self, tmp_path: Path) -> None:
         """done_command returns 0 when completion pipeline passes."""
         session = _make_session("IMP-10")
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.load.return_value = session
         mock_pipeline = MagicMock()
         mock_pipeline.run.return_value = _make_completion_result("IMP-10", passed=True)
@@ -288,7 +317,7 @@ class TestDoneCommand:
     def test_returns_1_when_review_finds_issues(self, tmp_path: Path) -> None:
         """done_command returns 1 when review finds issues (exit_code=1)."""
         session = _make_session("IMP-11")
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.load.return_value = session
         mock_pipeline = MagicMock()
         mock_pipeline.run.return_value = _make_completion_result("IMP-11", passed=False)
@@ -306,7 +335,7 @@ class TestDoneCommand:
     def test_returns_2_on_escalation(self, tmp_path: Path) -> None:
         """done_command returns 2 when pipeline escalates (circuit break)."""
         session = _make_session("IMP-12")
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.load.return_value = session
         mock_pipeline = MagicMock()
         mock_pipeline.run.return_value = _make_completion_result(
@@ -325,7 +354,7 @@ class TestDoneCommand:
 
     def test_returns_1_if_session_not_found(self, tmp_path: Path) -> None:
         """done_command returns 1 if no session exists for the ticket."""
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.load.return_value = None
         mock_pipeline = MagicMock()
         mock_logger = MagicMock()
@@ -343,7 +372,7 @@ class TestDoneCommand:
     def test_logs_decision_on_completion(self, tmp_path: Path) -> None:
         """done_command calls DecisionLogger.log_completion after pipeline."""
         session = _make_session("IMP-13")
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.load.return_value = session
         completion_result = _make_completion_result("IMP-13", passed=True)
         mock_pipeline = MagicMock()
@@ -362,7 +391,7 @@ class TestDoneCommand:
     def test_updates_session_status(self, tmp_path: Path) -> None:
         """done_command saves updated session status to the store."""
         session = _make_session("IMP-14", status=SessionStatus.active)
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.load.return_value = session
         mock_pipeline = MagicMock()
         mock_pipeline.run.return_value = _make_completion_result("IMP-14", passed=True)
@@ -390,7 +419,7 @@ class TestListCommand:
     def test_returns_0_with_active_sessions(self, tmp_path: Path) -> None:
         """list_command returns 0 when there are active sessions."""
         sessions = [_make_session("IMP-20"), _make_session("IMP-21")]
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.list_sessions.return_value = sessions
 
         with patch("imp.executor.cli.SessionStore", return_value=mock_store):
@@ -400,7 +429,7 @@ class TestListCommand:
 
     def test_returns_0_with_no_sessions(self, tmp_path: Path) -> None:
         """list_command returns 0 even when there are no sessions."""
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.list_sessions.return_value = []
 
         with patch("imp.executor.cli.SessionStore", return_value=mock_store):
@@ -413,7 +442,7 @@ class TestListCommand:
     ) -> None:
         """list_command with human format produces output without crashing."""
         sessions = [_make_session("IMP-22")]
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.list_sessions.return_value = sessions
 
         with patch("imp.executor.cli.SessionStore", return_value=mock_store):
@@ -426,7 +455,7 @@ class TestListCommand:
     ) -> None:
         """list_command with json format outputs parseable JSON."""
         sessions = [_make_session("IMP-23")]
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.list_sessions.return_value = sessions
 
         with patch("imp.executor.cli.SessionStore", return_value=mock_store):
@@ -454,7 +483,7 @@ class TestCleanCommand:
         escalated_session = _make_session("IMP-31", status=SessionStatus.escalated)
         active_session = _make_session("IMP-32", status=SessionStatus.active)
 
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.list_sessions.return_value = [done_session, escalated_session, active_session]
         mock_worktree_mgr = MagicMock()
 
@@ -472,7 +501,7 @@ class TestCleanCommand:
         """clean_command skips active sessions unless --force is used."""
         active_session = _make_session("IMP-33", status=SessionStatus.active)
 
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.list_sessions.return_value = [active_session]
         mock_worktree_mgr = MagicMock()
 
@@ -490,7 +519,7 @@ class TestCleanCommand:
         active_session = _make_session("IMP-34", status=SessionStatus.active)
         done_session = _make_session("IMP-35", status=SessionStatus.done)
 
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.list_sessions.return_value = [active_session, done_session]
         mock_worktree_mgr = MagicMock()
 
@@ -507,7 +536,7 @@ class TestCleanCommand:
         """clean_command removes worktrees for cleaned sessions."""
         done_session = _make_session("IMP-36", status=SessionStatus.done)
 
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.list_sessions.return_value = [done_session]
         mock_worktree_mgr = MagicMock()
 
@@ -521,7 +550,7 @@ class TestCleanCommand:
 
     def test_returns_0_on_success(self, tmp_path: Path) -> None:
         """clean_command returns 0 on success."""
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.list_sessions.return_value = []
         mock_worktree_mgr = MagicMock()
 
@@ -535,7 +564,7 @@ class TestCleanCommand:
 
     def test_returns_0_with_no_sessions_to_clean(self, tmp_path: Path) -> None:
         """clean_command returns 0 even when there are no sessions to clean."""
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.list_sessions.return_value = []
         mock_worktree_mgr = MagicMock()
 
@@ -552,7 +581,7 @@ class TestCleanCommand:
         """clean_command removes cleaned sessions from the SessionStore."""
         done_session = _make_session("IMP-37", status=SessionStatus.done)
 
-        mock_store = MagicMock()
+        mock_store = _mock_store()
         mock_store.list_sessions.return_value = [done_session]
         mock_worktree_mgr = MagicMock()
 
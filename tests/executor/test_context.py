@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from imp.executor.context import ContextGenerator
+from imp.executor.context import ContextGenerator, _render
 from imp.executor.models import ContextBudget, WorktreeSession
 
 
@@ -211,6 +211,39 @@ class TestContextGeneratorGenerate:
         assert "## Context Budget" in result
 
 
+class TestContextGeneratorRenderCache:
+    """Test that rendering is memoized on the session fields and scan modules."""
+
+    def test_repeat_generate_hits_cache(self, tmp_path: Path) -> None:
+        """A second generate() for an identical session and scan is a cache hit."""
+        _render.cache_clear()
+        gen = ContextGenerator(tmp_path)
+
+        first = gen.generate(_make_session(), scan_data=_make_scan_data())
+        second = gen.generate(_make_session(), scan_data=_make_scan_data())
+
+        assert second == first
+        assert _render.cache_info().hits == 1
+
+    def test_changed_budget_renders_again(self, tmp_path: Path) -> None:
+        """Sessions differing only in budget do not share a cached render."""
+        gen = ContextGenerator(tmp_path)
+        session = _make_session()
+        before = gen.generate(session)
+
+        session.context_budget = ContextBudget(used_tokens=10_000)
+        after = gen.generate(session)
+
+        assert "10,000" not in before
+        assert "10,000" in after
+
+    def test_empty_scan_modules_differ_from_no_scan(self, tmp_path: Path) -> None:
+        """scan_data without modules still renders the scanned-modules body."""
+        gen = ContextGenerator(tmp_path)
+        assert "Scanned modules:" in gen.generate(_make_session(), scan_data={})
+        assert "Scanned modules:" not in gen.generate(_make_session())
+
+
 class TestContextGeneratorWriteTaskFile:
     """Test write_task_file() method."""
 
@@ -0,0 +1,33 @@
+"""Tests for executor model file I/O."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from imp.executor.io import read_model, write_model
+from imp.executor.models import CleanResult, WorktreeSession
+
+
+class TestModelFileIO:
+    """Test write_model and read_model round-trips."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """A model written with write_model reads back equal."""
+        session = WorktreeSession(ticket_id="IMP-IO", title="I/O — round trip")
+        path = tmp_path / "session.json"
+
+        write_model(path, session)
+
+        assert read_model(WorktreeSession, path) == session
+
+    def test_matches_model_dump_json(self, tmp_path: Path) -> None:
+        """The file holds the same UTF-8 JSON that model_dump_json produces."""
+        clean = CleanResult(removed_sessions=["IMP-1"])
+        indented = tmp_path / "indented.json"
+        compact = tmp_path / "compact.json"
+
+        write_model(indented, clean)
+        write_model(compact, clean, indent=None)
+
+        assert indented.read_text(encoding="utf-8") == clean.model_dump_json(indent=2)
+        assert compact.read_text(encoding="utf-8") == clean.model_dump_json()
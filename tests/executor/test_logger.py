@@ -6,6 +6,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from imp.executor.logger import DecisionLogger
 from imp.executor.models import CompletionAttempt, DecisionEntry
 
@@ -46,6 +48,32 @@ class TestDecisionLoggerCreation:
         assert logger.decisions_dir == tmp_path / ".imp" / "decisions"
 
 
+class TestDecisionFileFormat:
+    """Test decision JSON is compact by default and indented on request."""
+
+    @pytest.mark.parametrize(
+        ("pretty", "expected_prefix"),
+        [
+            pytest.param(False, b'{"ticket_id":"IMP-50"', id="compact"),
+            pytest.param(True, b'{\n  "ticket_id": "IMP-50"', id="pretty"),
+        ],
+    )
+    def test_log_completion_json_layout(
+        self, tmp_path: Path, pretty: bool, expected_prefix: bytes
+    ) -> None:
+        """pretty=True indents the decision file; either form loads back."""
+        logger = DecisionLogger(project_root=tmp_path, pretty=pretty)
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=1)
+            entry = logger.log_completion(
+                ticket_id="IMP-50", attempts=[], outcome="done", worktree_path=tmp_path
+            )
+
+        raw = (logger.decisions_dir / "IMP-50.json").read_bytes()
+        assert raw.startswith(expected_prefix)
+        assert logger.load("IMP-50") == entry
+
+
 # ---------------------------------------------------------------------------
 # log_completion
 # ---------------------------------------------------------------------------
@@ -78,7 +106,7 @@ class TestLogCompletion:
 
         assert entry.ticket_id == "IMP-1"
         assert entry.outcome == "done"
-        assert entry.attempt_history == attempts
+        assert entry.attempt_history == tuple(attempts)
 
     def test_log_completion_saves_to_correct_path(self, tmp_path: Path) -> None:
         """log_completion saves JSON to .imp/decisions/{ticket_id}.json."""
@@ -155,7 +183,7 @@ class TestLogCompletion:
                 worktree_path=worktree,
             )
 
-        assert isinstance(entry.files_changed, list)
+        assert isinstance(entry.files_changed, tuple)
         assert len(entry.files_changed) >= 2
 
     def test_log_completion_skips_empty_file_parts_in_diff(self, tmp_path: Path) -> None:
@@ -180,7 +208,7 @@ class TestLogCompletion:
                 worktree_path=worktree,
             )
 
-        assert entry.files_changed == ["src/a.py"]
+        assert entry.files_changed == ("src/a.py",)
 
     def test_log_completion_directory_auto_created_on_first_write(self, tmp_path: Path) -> None:
         """The .imp/decisions/ directory is created automatically."""
@@ -387,3 +415,138 @@ class TestListDecisions:
 
         for entry in entries:
             assert isinstance(entry, DecisionEntry)
+
+
+# ---------------------------------------------------------------------------
+# Attempt output sidecars
+# ---------------------------------------------------------------------------
+
+
+def _log_with_outputs(logger: DecisionLogger, worktree: Path) -> list[CompletionAttempt]:
+    attempts = [
+        _make_attempt(1, passed=False, output="lint error"),
+        CompletionAttempt(
+            attempt_number=2,
+            check_passed=True,
+            check_output="ok",
+            review_passed=True,
+            review_output="no issues",
+            timestamp=datetime.now(UTC),
+        ),
+    ]
+    with patch("subprocess.run") as mock_run:
+        proc = MagicMock()
+        proc.returncode = 1
+        mock_run.return_value = proc
+        logger.log_completion(
+            ticket_id="IMP-40",
+            attempts=attempts,
+            outcome="done",
+            worktree_path=worktree,
+        )
+    return attempts
+
+
+class TestAttemptOutputSidecars:
+    """Test attempt outputs are stored beside the JSON and loaded on demand."""
+
+    def test_outputs_written_to_sidecars_not_json(self, tmp_path: Path) -> None:
+        """Non-empty outputs go to attempts/{n}.{kind}.log; the JSON leaves them empty."""
+        logger = DecisionLogger(project_root=tmp_path)
+        _log_with_outputs(logger, tmp_path)
+
+        attempts_dir = tmp_path / ".imp" / "decisions" / "IMP-40" / "attempts"
+        assert sorted(p.name for p in attempts_dir.iterdir()) == [
+            "1.check.log",
+            "2.check.log",
+            "2.review.log",
+        ]
+        assert (attempts_dir / "2.review.log").read_text() == "no issues"
+        raw = (tmp_path / ".imp" / "decisions" / "IMP-40.json").read_bytes()
+        assert b"lint error" not in raw
+        assert b"no issues" not in raw
+
+    def test_load_resolves_outputs(self, tmp_path: Path) -> None:
+        """load() round-trips the attempts exactly by default."""
+        logger = DecisionLogger(project_root=tmp_path)
+        attempts = _log_with_outputs(logger, tmp_path)
+
+        loaded = logger.load("IMP-40")
+
+        assert loaded is not None
+        assert loaded.attempt_history == tuple(attempts)
+
+    def test_lazy_load_leaves_outputs_empty(self, tmp_path: Path) -> None:
+        """load(lazy=True) reads metadata only."""
+        logger = DecisionLogger(project_root=tmp_path)
+        _log_with_outputs(logger, tmp_path)
+
+        loaded = logger.load("IMP-40", lazy=True)
+
+        assert loaded is not None
+        assert [(a.check_output, a.review_output) for a in loaded.attempt_history] == [
+            ("", ""),
+            ("", ""),
+        ]
+
+    def test_resolve_outputs_on_lazy_entry(self, tmp_path: Path) -> None:
+        """resolve_outputs() fills in a lazily loaded entry."""
+        logger = DecisionLogger(project_root=tmp_path)
+        attempts = _log_with_outputs(logger, tmp_path)
+        lazy = logger.load("IMP-40", lazy=True)
+        assert lazy is not None
+
+        assert logger.resolve_outputs(lazy).attempt_history == tuple(attempts)
+
+    def test_list_decisions_resolves_outputs_unless_lazy(self, tmp_path: Path) -> None:
+        """list_decisions() includes attempt outputs; lazy=True leaves them empty."""
+        logger = DecisionLogger(project_root=tmp_path)
+        attempts = _log_with_outputs(logger, tmp_path)
+
+        [entry] = logger.list_decisions()
+        [lazy] = logger.list_decisions(lazy=True)
+
+        assert entry.attempt_history == tuple(attempts)
+        assert lazy.attempt_history[0].check_output == ""
+
+    def test_relog_removes_stale_sidecars(self, tmp_path: Path) -> None:
+        """Re-logging a ticket drops sidecars from the earlier log."""
+        logger = DecisionLogger(project_root=tmp_path)
+        _log_with_outputs(logger, tmp_path)
+        attempt = _make_attempt(1, passed=False, output="")
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=1)
+            logger.log_completion(
+                ticket_id="IMP-40",
+                attempts=[attempt],
+                outcome="failed",
+                worktree_path=tmp_path,
+            )
+
+        loaded = logger.load("IMP-40")
+        assert loaded is not None
+        assert loaded.attempt_history == (attempt,)
+        attempts_dir = tmp_path / ".imp" / "decisions" / "IMP-40" / "attempts"
+        assert list(attempts_dir.iterdir()) == []
+
+    def test_resolve_outputs_keeps_inline_outputs_without_sidecars(self, tmp_path: Path) -> None:
+        """Entries logged with outputs inside the JSON resolve unchanged."""
+        logger = DecisionLogger(project_root=tmp_path)
+        entry = DecisionEntry(
+            ticket_id="IMP-OLD",
+            diff_summary="",
+            attempt_history=(_make_attempt(1, output="inline"),),
+            outcome="done",
+        )
+
+        assert logger.resolve_outputs(entry) is entry
+
+    def test_list_decisions_skips_sidecar_dirs_and_other_files(self, tmp_path: Path) -> None:
+        """Only *.json files are listed; attempt sidecar directories and stray files are not."""
+        logger = DecisionLogger(project_root=tmp_path)
+        _log_with_outputs(logger, tmp_path)
+        (logger.decisions_dir / "notes.txt").write_text("not a decision")
+        (logger.decisions_dir / "dir.json").mkdir()
+
+        assert [e.ticket_id for e in logger.list_decisions()] == ["IMP-40"]
@@ -16,35 +16,37 @@ from imp.executor.models import (
     SessionListEntry,
     SessionStatus,
     WorktreeSession,
+    ticket_paths,
 )
 
 
-class TestSessionStatus:
-    """Test SessionStatus StrEnum."""
+@pytest.fixture(scope="module")
+def minimal_session() -> WorktreeSession:
+    """Shared read-only session, built once without validation."""
+    return WorktreeSession.model_construct(ticket_id="IMP-001", title="Test")
 
-    def test_active_value(self) -> None:
-        """SessionStatus.active has correct string value."""
-        assert SessionStatus.active == "active"
 
-    def test_done_value(self) -> None:
-        """SessionStatus.done has correct string value."""
-        assert SessionStatus.done == "done"
+class TestSessionStatus:
+    """Test SessionStatus StrEnum."""
 
-    def test_escalated_value(self) -> None:
-        """SessionStatus.escalated has correct string value."""
-        assert SessionStatus.escalated == "escalated"
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            (SessionStatus.active, "active"),
+            (SessionStatus.done, "done"),
+            (SessionStatus.escalated, "escalated"),
+        ],
+    )
+    def test_values(self, member: SessionStatus, expected: str) -> None:
+        """Each SessionStatus has the expected value and compares equal to it."""
+        assert member.value == expected
+        assert member == expected
 
     def test_all_values(self) -> None:
         """All required status values are defined."""
         values = {s.value for s in SessionStatus}
         assert values == {"active", "done", "escalated"}
 
-    def test_string_comparison(self) -> None:
-        """SessionStatus compares equal to string values."""
-        assert SessionStatus.active == "active"
-        assert SessionStatus.done == "done"
-        assert SessionStatus.escalated == "escalated"
-
 
 class TestContextBudget:
     """Test ContextBudget model."""
@@ -73,25 +75,19 @@ class TestContextBudget:
         budget = ContextBudget()
         assert budget.available_tokens == 150_000
 
-    def test_usage_pct_property(self) -> None:
-        """usage_pct = used / max * 100."""
-        budget = ContextBudget(max_tokens=200_000, used_tokens=50_000)
-        assert budget.usage_pct == pytest.approx(25.0)
-
-    def test_usage_pct_zero(self) -> None:
-        """usage_pct is 0.0 when nothing used."""
-        budget = ContextBudget()
-        assert budget.usage_pct == 0.0
-
-    def test_usage_pct_high(self) -> None:
-        """usage_pct works at high utilization."""
-        budget = ContextBudget(max_tokens=200_000, used_tokens=180_000)
-        assert budget.usage_pct == pytest.approx(90.0)
+    @pytest.mark.parametrize(
+        ("used_tokens", "expected"),
+        [(0, 0.0), (50_000, 25.0), (180_000, 90.0)],
+    )
+    def test_usage_pct(self, used_tokens: int, expected: float) -> None:
+        """usage_pct = used / max * 100, from idle to high utilization."""
+        budget = ContextBudget(max_tokens=200_000, used_tokens=used_tokens)
+        assert budget.usage_pct == pytest.approx(expected)
 
     def test_frozen(self) -> None:
         """ContextBudget is immutable (frozen=True)."""
         budget = ContextBudget()
-        with pytest.raises((ValidationError, TypeError)):
+        with pytest.raises(ValidationError, match="frozen"):
             budget.used_tokens = 5000  # type: ignore[misc]
 
     def test_serialization(self) -> None:
@@ -127,15 +123,13 @@ class TestWorktreeSession:
         assert session.attempt_count == 0
         assert session.max_attempts == 3
 
-    def test_branch_computed_field(self) -> None:
-        """Branch is computed as imp/{ticket_id}."""
-        session = WorktreeSession(ticket_id="IMP-005", title="Test")
-        assert session.branch == "imp/IMP-005"
+    def test_branch_derived_from_ticket_id(self, minimal_session: WorktreeSession) -> None:
+        """Branch is derived as imp/{ticket_id}."""
+        assert minimal_session.branch == "imp/IMP-001"
 
-    def test_worktree_path_computed_field(self) -> None:
-        """worktree_path is computed as .trees/{ticket_id}."""
-        session = WorktreeSession(ticket_id="IMP-007", title="Test")
-        assert session.worktree_path == ".trees/IMP-007"
+    def test_worktree_path_derived_from_ticket_id(self, minimal_session: WorktreeSession) -> None:
+        """worktree_path is derived as .trees/{ticket_id}."""
+        assert minimal_session.worktree_path == ".trees/IMP-001"
 
     def test_created_at_auto_set(self) -> None:
         """created_at is auto-populated."""
@@ -143,12 +137,19 @@ class TestWorktreeSession:
         session = WorktreeSession(ticket_id="IMP-001", title="Test")
         after = datetime.now(UTC)
         assert before <= session.created_at <= after
+        assert session.created_at.tzinfo is UTC
 
-    def test_context_budget_default(self) -> None:
+    def test_context_budget_default(self, minimal_session: WorktreeSession) -> None:
         """context_budget defaults to ContextBudget()."""
-        session = WorktreeSession(ticket_id="IMP-001", title="Test")
-        assert isinstance(session.context_budget, ContextBudget)
-        assert session.context_budget.max_tokens == 200_000
+        assert isinstance(minimal_session.context_budget, ContextBudget)
+        assert minimal_session.context_budget.max_tokens == 200_000
+
+    def test_context_budget_not_shared(self) -> None:
+        """Each session gets its own default ContextBudget and created_at."""
+        first = WorktreeSession(ticket_id="IMP-001", title="Test")
+        second = WorktreeSession(ticket_id="IMP-002", title="Test")
+        assert first.context_budget == second.context_budget
+        assert first.context_budget is not second.context_budget
 
     def test_is_mutable(self) -> None:
         """WorktreeSession is mutable (frozen=False)."""
@@ -224,6 +225,80 @@ class TestWorktreeSession:
         assert session.ticket_id == "IMP-002"
         assert session.status == SessionStatus.done
         assert session.attempt_count == 1
+        assert session.branch == "imp/IMP-002"
+        assert "branch" not in WorktreeSession.model_fields
+
+    def test_paths_shared_across_sessions(self) -> None:
+        """Sessions for the same ticket share the same interned path strings."""
+        first = WorktreeSession(ticket_id="IMP-042", title="First")
+        second = WorktreeSession(ticket_id="IMP-042", title="Second")
+        assert first.branch is second.branch
+        assert first.worktree_path is second.worktree_path
+
+    def test_paths_match_ticket_paths(self) -> None:
+        """branch/worktree_path come from ticket_paths, shared with WorktreeManager."""
+        session = WorktreeSession(ticket_id="IMP-043", title="Shared")
+        assert ticket_paths("IMP-043") == ("imp/IMP-043", ".trees/IMP-043")
+        assert (session.branch, session.worktree_path) == ticket_paths("IMP-043")
+
+    def test_paths_follow_ticket_id_changes(self) -> None:
+        """branch/worktree_path track ticket_id after copy or reassignment."""
+        session = WorktreeSession(ticket_id="IMP-001", title="Test")
+        assert session.branch == "imp/IMP-001"
+        copied = session.model_copy(update={"ticket_id": "IMP-002"})
+        assert copied.branch == "imp/IMP-002"
+        session.ticket_id = "IMP-003"
+        assert session.worktree_path == ".trees/IMP-003"
+
+    def test_deserialization_ignores_stored_paths(self) -> None:
+        """Stored branch/worktree_path are ignored in favour of ticket_id."""
+        data = {
+            "ticket_id": "IMP-003",
+            "title": "Stale paths",
+            "branch": "imp/OLD",
+            "worktree_path": ".trees/OLD",
+        }
+        session = WorktreeSession.model_validate(data)
+        assert session.branch == "imp/IMP-003"
+        assert session.worktree_path == ".trees/IMP-003"
+
+    def test_json_roundtrip_includes_paths(self) -> None:
+        """model_dump_json emits branch/worktree_path and reloads cleanly."""
+        session = WorktreeSession(ticket_id="IMP-004", title="Roundtrip")
+        restored = WorktreeSession.model_validate_json(session.model_dump_json())
+        assert restored == session
+        assert restored.model_dump()["worktree_path"] == ".trees/IMP-004"
+
+    def test_paths_respect_exclude(self) -> None:
+        """branch/worktree_path honour model_dump exclude like regular fields."""
+        session = WorktreeSession(ticket_id="IMP-005", title="Exclude")
+        data = session.model_dump(exclude={"branch", "worktree_path"})
+        assert "branch" not in data
+        assert "worktree_path" not in data
+        assert data["ticket_id"] == "IMP-005"
+
+    def test_paths_in_serialization_schema(self) -> None:
+        """The serialization JSON schema lists branch/worktree_path as read-only."""
+        schema = WorktreeSession.model_json_schema(mode="serialization")
+        assert schema["properties"]["branch"]["readOnly"] is True
+        assert schema["properties"]["worktree_path"]["type"] == "string"
+        assert "branch" not in WorktreeSession.model_json_schema()["properties"]
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("status", SessionStatus.done),
+            ("attempt_count", 2),
+            ("description", "A detailed description"),
+            ("context_budget", ContextBudget(used_tokens=12_000)),
+            ("created_at", datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=UTC)),
+        ],
+    )
+    def test_json_roundtrip_preserves_field(self, field: str, value: object) -> None:
+        """Each persisted field survives model_dump_json → model_validate_json."""
+        session = WorktreeSession(ticket_id="IMP-001", title="Test", **{field: value})
+        restored = WorktreeSession.model_validate_json(session.model_dump_json())
+        assert getattr(restored, field) == value
 
     def test_model_validate_from_existing_session(self) -> None:
         """model_validate with an existing WorktreeSession (non-dict values path)."""
@@ -232,6 +307,19 @@ class TestWorktreeSession:
         assert validated.ticket_id == "IMP-COPY"
         assert validated.branch == "imp/IMP-COPY"
 
+    @pytest.mark.parametrize("ticket_id", ["IMP-001", "t-1", "IMP-5b", "PROJ_2.1"])
+    def test_ticket_id_accepts_safe_ids(self, ticket_id: str) -> None:
+        """Alphanumeric ids joined by '.', '_' or '-' are accepted."""
+        assert WorktreeSession(ticket_id=ticket_id, title="Test").ticket_id == ticket_id
+
+    @pytest.mark.parametrize(
+        "ticket_id", ["", "../etc", "IMP/001", "IMP 001", "-rf", "IMP-", "IMP..1"]
+    )
+    def test_ticket_id_rejects_malformed(self, ticket_id: str) -> None:
+        """Ids that are unsafe as branch or path components raise ValidationError."""
+        with pytest.raises(ValidationError, match="invalid ticket_id"):
+            WorktreeSession(ticket_id=ticket_id, title="Test")
+
 
 class TestCompletionAttempt:
     """Test CompletionAttempt model."""
@@ -284,6 +372,19 @@ class TestCompletionAttempt:
         assert attempt.review_output == "LGTM"
         assert attempt.timestamp == now
 
+    def test_timestamp_defaults_to_now(self) -> None:
+        """timestamp is auto-populated with the current UTC time."""
+        before = datetime.now(UTC)
+        attempt = CompletionAttempt(attempt_number=1, check_passed=True)
+        after = datetime.now(UTC)
+        assert before <= attempt.timestamp <= after
+        assert attempt.timestamp.tzinfo is UTC
+
+    def test_timestamp_accepts_unix_float(self) -> None:
+        """A float unix timestamp is coerced to an aware datetime."""
+        attempt = CompletionAttempt(attempt_number=1, check_passed=True, timestamp=0.0)
+        assert attempt.timestamp == datetime(1970, 1, 1, tzinfo=UTC)
+
     def test_frozen(self) -> None:
         """CompletionAttempt is immutable (frozen=True)."""
         attempt = CompletionAttempt(
@@ -291,7 +392,7 @@ class TestCompletionAttempt:
             check_passed=True,
             timestamp=datetime.now(UTC),
         )
-        with pytest.raises((ValidationError, TypeError)):
+        with pytest.raises(ValidationError, match="frozen"):
             attempt.check_passed = False  # type: ignore[misc]
 
     def test_serialization(self) -> None:
@@ -326,20 +427,23 @@ class TestCompletionResult:
         assert result.commit_hash is None
         assert result.pm_updated is False
 
-    def test_exit_code_passed(self) -> None:
-        """exit_code is 0 when passed=True."""
-        result = CompletionResult(ticket_id="IMP-001", passed=True, attempts=[])
-        assert result.exit_code == 0
-
-    def test_exit_code_escalated(self) -> None:
-        """exit_code is 2 when escalated=True."""
-        result = CompletionResult(ticket_id="IMP-001", passed=False, escalated=True, attempts=[])
-        assert result.exit_code == 2
+    @pytest.mark.parametrize(
+        ("passed", "escalated", "expected"),
+        [(True, False, 0), (False, True, 2), (False, False, 1)],
+        ids=["passed", "escalated", "failed"],
+    )
+    def test_exit_code(self, passed: bool, escalated: bool, expected: int) -> None:
+        """exit_code is 0 when passed, 2 when escalated, 1 otherwise."""
+        result = CompletionResult(
+            ticket_id="IMP-001", passed=passed, escalated=escalated, attempts=[]
+        )
+        assert result.exit_code == expected
 
-    def test_exit_code_failed(self) -> None:
-        """exit_code is 1 when passed=False and not escalated."""
-        result = CompletionResult(ticket_id="IMP-001", passed=False, attempts=[])
-        assert result.exit_code == 1
+    def test_exit_code_follows_copies(self) -> None:
+        """exit_code reflects the fields of a model_copy, and is not serialized."""
+        result = CompletionResult(ticket_id="IMP-001", passed=True, attempts=[])
+        assert result.model_copy(update={"passed": False}).exit_code == 1
+        assert "exit_code" not in result.model_dump()
 
     def test_full_instantiation(self) -> None:
         """CompletionResult accepts all fields."""
@@ -362,7 +466,7 @@ class TestCompletionResult:
     def test_frozen(self) -> None:
         """CompletionResult is immutable (frozen=True)."""
         result = CompletionResult(ticket_id="IMP-001", passed=True, attempts=[])
-        with pytest.raises((ValidationError, TypeError)):
+        with pytest.raises(ValidationError, match="frozen"):
             result.passed = False  # type: ignore[misc]
 
     def test_serialization(self) -> None:
@@ -391,7 +495,7 @@ class TestDecisionEntry:
         )
         assert entry.ticket_id == "IMP-001"
         assert entry.outcome == "completed"
-        assert entry.files_changed == ["src/imp/executor/models.py"]
+        assert entry.files_changed == ("src/imp/executor/models.py",)
 
     def test_frozen(self) -> None:
         """DecisionEntry is immutable (frozen=True)."""
@@ -404,7 +508,7 @@ class TestDecisionEntry:
             attempt_history=[],
             outcome="completed",
         )
-        with pytest.raises((ValidationError, TypeError)):
+        with pytest.raises(ValidationError, match="frozen"):
             entry.outcome = "escalated"  # type: ignore[misc]
 
     def test_with_attempt_history(self) -> None:
@@ -436,7 +540,24 @@ class TestDecisionEntry:
         data = entry.model_dump()
         assert data["ticket_id"] == "IMP-001"
         assert data["outcome"] == "escalated"
-        assert data["files_changed"] == ["a.py", "b.py"]
+        assert data["files_changed"] == ("a.py", "b.py")
+
+    def test_decision_entry_json_roundtrip(self) -> None:
+        """model_dump_json → model_validate_json preserves nested attempts."""
+        attempt = CompletionAttempt(
+            attempt_number=1, check_passed=True, review_passed=False, review_output="nit"
+        )
+        entry = DecisionEntry(
+            ticket_id="IMP-001",
+            files_changed=["a.py", "b.py"],
+            diff_summary="2 files changed",
+            attempt_history=[attempt],
+            outcome="failed",
+        )
+        raw = entry.model_dump_json()
+        reparsed = DecisionEntry.model_validate_json(raw)
+        assert reparsed == entry
+        assert DecisionEntry.model_validate_json(raw.encode()) == entry
 
 
 class TestSessionListEntry:
@@ -467,9 +588,22 @@ class TestSessionListEntry:
             attempt_count=0,
             created_at=now,
         )
-        with pytest.raises((ValidationError, TypeError)):
+        with pytest.raises(ValidationError, match="frozen"):
             entry.status = SessionStatus.done  # type: ignore[misc]
 
+    def test_rejects_unknown_fields(self) -> None:
+        """SessionListEntry forbids extra fields (extra="forbid")."""
+        with pytest.raises(ValidationError, match="Extra inputs"):
+            SessionListEntry(
+                ticket_id="IMP-001",
+                title="Test",
+                status=SessionStatus.active,
+                branch="imp/IMP-001",
+                attempt_count=0,
+                created_at=datetime.now(UTC),
+                worktree_path=".trees/IMP-001",  # type: ignore[call-arg]
+            )
+
     def test_serialization(self) -> None:
         """SessionListEntry serializes to dict."""
         now = datetime.now(UTC)
@@ -486,6 +620,21 @@ class TestSessionListEntry:
         assert data["status"] == "done"
         assert data["attempt_count"] == 2
 
+    def test_from_session(self) -> None:
+        """from_session builds the entry via model_construct, including the derived branch."""
+        session = WorktreeSession(ticket_id="IMP-003", title="From session", attempt_count=1)
+
+        entry = SessionListEntry.from_session(session)
+
+        assert entry == SessionListEntry(
+            ticket_id="IMP-003",
+            title="From session",
+            status=SessionStatus.active,
+            branch="imp/IMP-003",
+            attempt_count=1,
+            created_at=session.created_at,
+        )
+
 
 class TestCleanResult:
     """Test CleanResult model."""
@@ -497,9 +646,9 @@ class TestCleanResult:
             skipped_sessions=["IMP-003"],
             pruned_branches=["imp/IMP-001"],
         )
-        assert result.removed_sessions == ["IMP-001", "IMP-002"]
-        assert result.skipped_sessions == ["IMP-003"]
-        assert result.pruned_branches == ["imp/IMP-001"]
+        assert result.removed_sessions == ("IMP-001", "IMP-002")
+        assert result.skipped_sessions == ("IMP-003",)
+        assert result.pruned_branches == ("imp/IMP-001",)
 
     def test_empty_lists(self) -> None:
         """CleanResult works with empty lists."""
@@ -508,9 +657,33 @@ class TestCleanResult:
             skipped_sessions=[],
             pruned_branches=[],
         )
-        assert result.removed_sessions == []
-        assert result.skipped_sessions == []
-        assert result.pruned_branches == []
+        assert result.removed_sessions == ()
+        assert result.skipped_sessions == ()
+        assert result.pruned_branches == ()
+
+    def test_defaults_to_empty_tuples(self) -> None:
+        """All CleanResult fields default to empty tuples."""
+        result = CleanResult()
+        assert result.removed_sessions == ()
+        assert result.skipped_sessions == ()
+        assert result.pruned_branches == ()
+
+    def test_rejects_unknown_fields(self) -> None:
+        """CleanResult forbids extra fields (extra="forbid")."""
+        with pytest.raises(ValidationError, match="Extra inputs"):
+            CleanResult.model_validate({"removed_sessions": [], "removed": ["IMP-001"]})
+
+    def test_hashable(self) -> None:
+        """Tuple fields make CleanResult hashable."""
+        a = CleanResult(removed_sessions=["IMP-001"])
+        b = CleanResult(removed_sessions=("IMP-001",))
+        assert a == b
+        assert hash(a) == hash(b)
+
+    def test_json_uses_arrays(self) -> None:
+        """Tuple fields still serialize as JSON arrays."""
+        result = CleanResult(removed_sessions=["IMP-001"])
+        assert result.model_dump(mode="json")["removed_sessions"] == ["IMP-001"]
 
     def test_frozen(self) -> None:
         """CleanResult is immutable (frozen=True)."""
@@ -519,7 +692,7 @@ class TestCleanResult:
             skipped_sessions=[],
             pruned_branches=[],
         )
-        with pytest.raises((ValidationError, TypeError)):
+        with pytest.raises(ValidationError, match="frozen"):
             result.removed_sessions = ["IMP-999"]  # type: ignore[misc]
 
     def test_serialization(self) -> None:
@@ -530,9 +703,9 @@ class TestCleanResult:
             pruned_branches=["imp/IMP-001"],
         )
         data = result.model_dump()
-        assert data["removed_sessions"] == ["IMP-001"]
-        assert data["skipped_sessions"] == ["IMP-002"]
-        assert data["pruned_branches"] == ["imp/IMP-001"]
+        assert data["removed_sessions"] == ("IMP-001",)
+        assert data["skipped_sessions"] == ("IMP-002",)
+        assert data["pruned_branches"] == ("imp/IMP-001",)
 
     def test_deserialization(self) -> None:
         """CleanResult deserializes from dict."""
@@ -542,5 +715,5 @@ class TestCleanResult:
             "pruned_branches": ["imp/IMP-005"],
         }
         result = CleanResult.model_validate(data)
-        assert result.removed_sessions == ["IMP-005"]
-        assert result.pruned_branches == ["imp/IMP-005"]
+        assert result.removed_sessions == ("IMP-005",)
+        assert result.pruned_branches == ("imp/IMP-005",)
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-import subprocess
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from unittest.mock import patch
+from typing import Any, ClassVar
+from unittest.mock import DEFAULT, MagicMock, patch
+
+import pytest
 
 from imp.executor.models import (
     CompletionAttempt,
@@ -12,7 +16,10 @@ from imp.executor.models import (
     SessionStatus,
     WorktreeSession,
 )
-from imp.executor.pipeline import CompletionPipeline
+from imp.executor.pipeline import CompletionPipeline, _import_plane_adapter
+from tests.executor._fakes import FAKE_ROOT, FakeRun, completed_process
+
+pytestmark = pytest.mark.usefixtures("fake_run")
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -23,12 +30,64 @@ def _make_session(ticket_id: str = "IMP-1") -> WorktreeSession:
     return WorktreeSession(ticket_id=ticket_id, title="Test ticket")
 
 
-def _completed_process(
-    returncode: int = 0, stdout: str = "", stderr: str = ""
-) -> subprocess.CompletedProcess[str]:
-    return subprocess.CompletedProcess(
-        args=[], returncode=returncode, stdout=stdout, stderr=stderr
-    )
+# Canned subprocess results, built once; the pipeline only reads them.
+_OK = completed_process()
+_CHECK_PASSED = completed_process(stdout="All checks passed")
+_CHECK_LINT_ERRORS = completed_process(returncode=1, stderr="Lint errors")
+_CHECK_TYPE_ERROR = completed_process(returncode=1, stderr="Type error")
+_REVIEW_RAW = '{"passed": true, "issues": []}'
+_REVIEW_PASSED = completed_process(stdout=_REVIEW_RAW)
+_REVIEW_ISSUES = completed_process(returncode=1, stdout='{"passed": false}')
+_GIT_FAILED = completed_process(returncode=1, stderr="fatal: git failed")
+_REV_PARSE_OK = completed_process(stdout="abc1234def\n")
+_REV_PARSE_EMPTY = completed_process(stdout="\n")
+
+
+class _StubAdapter:
+    """Stand-in PM adapter injected via _plane_adapter_cls; records comments."""
+
+    comments: ClassVar[list[tuple[str, str]]] = []
+
+    def __init__(self, config: Any) -> None:
+        self.config = config
+
+    def add_comment(self, ticket_id: str, comment: str) -> None:
+        self.comments.append((ticket_id, comment))
+
+
+class _FailingAdapter(_StubAdapter):
+    def add_comment(self, ticket_id: str, comment: str) -> None:
+        raise RuntimeError("PM failure")
+
+
+@pytest.fixture(scope="class")
+def pipeline() -> CompletionPipeline:
+    """One pipeline per test class; tests patch its helpers, never its state."""
+    return CompletionPipeline(project_root=FAKE_ROOT)
+
+
+@contextmanager
+def _patched_helpers(
+    pipeline: CompletionPipeline,
+    *,
+    check: tuple[bool, str] = (True, "ok"),
+    review: tuple[bool, str] = (True, "{}"),
+    commit: str | None = "abc1234",
+    pm: bool = True,
+) -> Iterator[dict[str, MagicMock]]:
+    """Patch the pipeline's four step helpers at once; yields the mocks by name."""
+    with patch.multiple(
+        pipeline,
+        _run_check=DEFAULT,
+        _run_review=DEFAULT,
+        _commit_changes=DEFAULT,
+        _update_pm=DEFAULT,
+    ) as mocks:
+        mocks["_run_check"].return_value = check
+        mocks["_run_review"].return_value = review
+        mocks["_commit_changes"].return_value = commit
+        mocks["_update_pm"].return_value = pm
+        yield mocks
 
 
 # ---------------------------------------------------------------------------
@@ -39,15 +98,15 @@ def _completed_process(
 class TestCompletionPipelineCreation:
     """Test CompletionPipeline initialization."""
 
-    def test_creation_with_project_root(self, tmp_path: Path) -> None:
+    def test_creation_with_project_root(self, fake_root: Path) -> None:
         """Can create CompletionPipeline with project_root."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
+        pipeline = CompletionPipeline(project_root=fake_root)
 
-        assert pipeline.project_root == tmp_path
+        assert pipeline.project_root == fake_root
 
-    def test_default_max_retries(self, tmp_path: Path) -> None:
+    def test_default_max_retries(self, fake_root: Path) -> None:
         """Default circuit breaker max retries is 3."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
+        pipeline = CompletionPipeline(project_root=fake_root)
 
         assert pipeline.max_retries == 3
 
@@ -60,67 +119,57 @@ class TestCompletionPipelineCreation:
 class TestRunCheck:
     """Test _run_check helper."""
 
-    def test_run_check_calls_correct_command(self, tmp_path: Path) -> None:
+    def test_run_check_calls_correct_command(
+        self, fake_root: Path, pipeline: CompletionPipeline, fake_run: FakeRun
+    ) -> None:
         """_run_check calls 'imp check' in the worktree directory."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        worktree = tmp_path / "worktree"
-        worktree.mkdir()
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _completed_process(returncode=0, stdout="All checks passed")
-            passed, output = pipeline._run_check(worktree)
-
-        call_kwargs = mock_run.call_args.kwargs
-        assert mock_run.call_args.args[0] == ["imp", "check"]
-        assert call_kwargs["cwd"] == worktree
-        assert call_kwargs["capture_output"] is True
-        assert call_kwargs["text"] is True
+        worktree = fake_root / "worktree"
+
+        fake_run.queue.append(_CHECK_PASSED)
+        passed, output = pipeline._run_check(worktree)
+
+        [(cmd, kwargs)] = fake_run.calls
+        assert cmd == ["imp", "check"]
+        assert kwargs["cwd"] == worktree
+        assert kwargs["capture_output"] is True
+        assert kwargs["text"] is True
         assert passed is True
         assert "All checks passed" in output
 
-    def test_run_check_strips_virtual_env_from_env(self, tmp_path: Path) -> None:
+    def test_run_check_strips_virtual_env_from_env(
+        self,
+        fake_root: Path,
+        pipeline: CompletionPipeline,
+        fake_run: FakeRun,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """_run_check removes VIRTUAL_ENV from subprocess env to avoid venv conflicts."""
-        import os
-
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        worktree = tmp_path / "worktree"
-        worktree.mkdir()
+        monkeypatch.setenv("VIRTUAL_ENV", "/some/parent/venv")
 
-        with (
-            patch("subprocess.run") as mock_run,
-            patch.dict(os.environ, {"VIRTUAL_ENV": "/some/parent/venv"}),
-        ):
-            mock_run.return_value = _completed_process(returncode=0)
-            pipeline._run_check(worktree)
+        pipeline._run_check(fake_root / "worktree")
 
-        env_passed = mock_run.call_args.kwargs.get("env", {})
-        assert "VIRTUAL_ENV" not in env_passed
+        [(_, kwargs)] = fake_run.calls
+        assert "VIRTUAL_ENV" not in kwargs["env"]
 
-    def test_run_check_returns_false_on_nonzero_exit(self, tmp_path: Path) -> None:
+    def test_run_check_returns_false_on_nonzero_exit(
+        self, fake_root: Path, pipeline: CompletionPipeline, fake_run: FakeRun
+    ) -> None:
         """_run_check returns (False, output) when imp check fails."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        worktree = tmp_path / "worktree"
-        worktree.mkdir()
+        worktree = fake_root / "worktree"
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _completed_process(
-                returncode=1, stdout="", stderr="Lint errors"
-            )
-            passed, _output = pipeline._run_check(worktree)
+        fake_run.queue.append(_CHECK_LINT_ERRORS)
+        passed, _output = pipeline._run_check(worktree)
 
         assert passed is False
 
-    def test_run_check_includes_stderr_in_output(self, tmp_path: Path) -> None:
+    def test_run_check_includes_stderr_in_output(
+        self, fake_root: Path, pipeline: CompletionPipeline, fake_run: FakeRun
+    ) -> None:
         """_run_check includes stderr content in output string."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        worktree = tmp_path / "worktree"
-        worktree.mkdir()
+        worktree = fake_root / "worktree"
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _completed_process(
-                returncode=1, stdout="", stderr="Type error"
-            )
-            passed, output = pipeline._run_check(worktree)
+        fake_run.queue.append(_CHECK_TYPE_ERROR)
+        passed, output = pipeline._run_check(worktree)
 
         assert passed is False
         assert "Type error" in output
@@ -134,47 +183,43 @@ class TestRunCheck:
 class TestRunReview:
     """Test _run_review helper."""
 
-    def test_run_review_calls_correct_command(self, tmp_path: Path) -> None:
+    def test_run_review_calls_correct_command(
+        self, fake_root: Path, pipeline: CompletionPipeline, fake_run: FakeRun
+    ) -> None:
         """_run_review calls 'imp review --format json' in the worktree directory."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        worktree = tmp_path / "worktree"
-        worktree.mkdir()
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _completed_process(returncode=0, stdout='{"passed": true}')
-            passed, _output = pipeline._run_review(worktree)
-
-        call_kwargs = mock_run.call_args.kwargs
-        assert mock_run.call_args.args[0] == ["imp", "review", "--format", "json"]
-        assert call_kwargs["cwd"] == worktree
-        assert call_kwargs["capture_output"] is True
-        assert call_kwargs["text"] is True
+        worktree = fake_root / "worktree"
+
+        fake_run.queue.append(_REVIEW_PASSED)
+        passed, _output = pipeline._run_review(worktree)
+
+        [(cmd, kwargs)] = fake_run.calls
+        assert cmd == ["imp", "review", "--format", "json"]
+        assert kwargs["cwd"] == worktree
+        assert kwargs["capture_output"] is True
+        assert kwargs["text"] is True
         assert passed is True
 
-    def test_run_review_returns_false_on_review_issues(self, tmp_path: Path) -> None:
+    def test_run_review_returns_false_on_review_issues(
+        self, fake_root: Path, pipeline: CompletionPipeline, fake_run: FakeRun
+    ) -> None:
         """_run_review returns (False, output) when review finds issues."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        worktree = tmp_path / "worktree"
-        worktree.mkdir()
+        worktree = fake_root / "worktree"
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _completed_process(returncode=1, stdout='{"passed": false}')
-            passed, _output = pipeline._run_review(worktree)
+        fake_run.queue.append(_REVIEW_ISSUES)
+        passed, _output = pipeline._run_review(worktree)
 
         assert passed is False
 
-    def test_run_review_returns_output(self, tmp_path: Path) -> None:
+    def test_run_review_returns_output(
+        self, fake_root: Path, pipeline: CompletionPipeline, fake_run: FakeRun
+    ) -> None:
         """_run_review returns the subprocess output."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        worktree = tmp_path / "worktree"
-        worktree.mkdir()
+        worktree = fake_root / "worktree"
 
-        raw = '{"passed": true, "issues": []}'
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _completed_process(returncode=0, stdout=raw)
-            _, output = pipeline._run_review(worktree)
+        fake_run.queue.append(_REVIEW_PASSED)
+        _, output = pipeline._run_review(worktree)
 
-        assert output == raw
+        assert output == _REVIEW_RAW
 
 
 # ---------------------------------------------------------------------------
@@ -185,83 +230,58 @@ class TestRunReview:
 class TestCommitChanges:
     """Test _commit_changes helper."""
 
-    def test_commit_changes_runs_git_add_and_commit(self, tmp_path: Path) -> None:
-        """_commit_changes runs git add then git commit."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        worktree = tmp_path / "worktree"
-        worktree.mkdir()
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                _completed_process(returncode=0),  # git add
-                _completed_process(returncode=0, stdout="abc1234"),  # git commit
-                _completed_process(returncode=0, stdout="abc1234\n"),  # git rev-parse
-            ]
-            pipeline._commit_changes(worktree, "IMP-1")
-
-        assert mock_run.call_count >= 2
-        first_call_args = mock_run.call_args_list[0][0][0]
-        assert "git" in first_call_args
-        assert "add" in first_call_args
-
-    def test_commit_changes_returns_hash_on_success(self, tmp_path: Path) -> None:
-        """_commit_changes returns commit hash on success."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        worktree = tmp_path / "worktree"
-        worktree.mkdir()
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                _completed_process(returncode=0),  # git add
-                _completed_process(
-                    returncode=0, stdout="[imp/IMP-1 abc1234] IMP-1: complete"
-                ),  # git commit
-                _completed_process(returncode=0, stdout="abc1234\n"),  # git rev-parse
-            ]
-            result = pipeline._commit_changes(worktree, "IMP-1")
-
-        assert result is not None
-
-    def test_commit_changes_returns_none_on_failure(self, tmp_path: Path) -> None:
-        """_commit_changes returns None when git commit fails."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        worktree = tmp_path / "worktree"
-        worktree.mkdir()
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                _completed_process(returncode=0),  # git add
-                _completed_process(returncode=1, stderr="nothing to commit"),  # git commit fails
-            ]
-            result = pipeline._commit_changes(worktree, "IMP-1")
+    def test_commit_changes_runs_git_add_commit_and_rev_parse(
+        self, fake_root: Path, pipeline: CompletionPipeline, fake_run: FakeRun
+    ) -> None:
+        """_commit_changes runs git add, git commit and git rev-parse in the worktree."""
+        worktree = fake_root / "worktree"
+
+        fake_run.queue.extend([_OK, _OK, _REV_PARSE_OK])
+        pipeline._commit_changes(worktree, "IMP-1")
+
+        assert [cmd for cmd, _ in fake_run.calls] == [
+            ["git", "add", "-A"],
+            ["git", "commit", "-m", "IMP-1: complete"],
+            ["git", "rev-parse", "HEAD"],
+        ]
+        assert all(kwargs["cwd"] == worktree for _, kwargs in fake_run.calls)
+
+    def test_commit_changes_returns_hash_on_success(
+        self, fake_root: Path, pipeline: CompletionPipeline, fake_run: FakeRun
+    ) -> None:
+        """_commit_changes returns the rev-parse hash on success."""
+        worktree = fake_root / "worktree"
+
+        fake_run.queue.extend([_OK, _OK, _REV_PARSE_OK])
+        result = pipeline._commit_changes(worktree, "IMP-1")
+
+        assert result == "abc1234def"
+
+    @pytest.mark.parametrize("failing_step", [0, 1, 2], ids=["add", "commit", "rev-parse"])
+    def test_commit_changes_stops_at_failed_step(
+        self,
+        fake_root: Path,
+        pipeline: CompletionPipeline,
+        fake_run: FakeRun,
+        failing_step: int,
+    ) -> None:
+        """_commit_changes returns None and skips later steps when a git call fails."""
+        worktree = fake_root / "worktree"
+
+        fake_run.queue.extend([_OK] * failing_step + [_GIT_FAILED])
+        result = pipeline._commit_changes(worktree, "IMP-1")
 
         assert result is None
+        assert len(fake_run.calls) == failing_step + 1
 
-    def test_commit_changes_returns_none_when_git_add_fails(self, tmp_path: Path) -> None:
-        """_commit_changes returns None when git add fails."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        worktree = tmp_path / "worktree"
-        worktree.mkdir()
+    def test_commit_changes_returns_none_on_empty_output(
+        self, fake_root: Path, pipeline: CompletionPipeline, fake_run: FakeRun
+    ) -> None:
+        """_commit_changes returns None when rev-parse prints no hash."""
+        worktree = fake_root / "worktree"
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _completed_process(returncode=1, stderr="add failed")
-            result = pipeline._commit_changes(worktree, "IMP-1")
-
-        assert result is None
-
-    def test_commit_changes_returns_none_when_rev_parse_fails(self, tmp_path: Path) -> None:
-        """_commit_changes returns None when git rev-parse fails."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        worktree = tmp_path / "worktree"
-        worktree.mkdir()
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                _completed_process(returncode=0),  # git add
-                _completed_process(returncode=0),  # git commit
-                _completed_process(returncode=1, stderr="rev-parse failed"),  # git rev-parse
-            ]
-            result = pipeline._commit_changes(worktree, "IMP-1")
+        fake_run.queue.extend([_OK, _OK, _REV_PARSE_EMPTY])
+        result = pipeline._commit_changes(worktree, "IMP-1")
 
         assert result is None
 
@@ -274,9 +294,11 @@ class TestCommitChanges:
 class TestUpdatePm:
     """Test _update_pm helper."""
 
-    def test_update_pm_returns_false_when_no_api_key(self, tmp_path: Path) -> None:
+    def test_update_pm_returns_false_when_no_api_key(
+        self, pipeline: CompletionPipeline, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """_update_pm returns False when PLANE_API_KEY is not set."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
+        monkeypatch.delenv("PLANE_API_KEY", raising=False)
         result = CompletionResult(
             ticket_id="IMP-1",
             passed=True,
@@ -284,20 +306,15 @@ class TestUpdatePm:
             commit_hash="abc1234",
         )
 
-        import os
-
-        env_backup = os.environ.pop("PLANE_API_KEY", None)
-        try:
-            outcome = pipeline._update_pm("IMP-1", result)
-        finally:
-            if env_backup is not None:
-                os.environ["PLANE_API_KEY"] = env_backup
+        outcome = pipeline._update_pm("IMP-1", result)
 
         assert outcome is False
 
-    def test_update_pm_does_not_raise_on_failure(self, tmp_path: Path) -> None:
+    def test_update_pm_does_not_raise_on_failure(
+        self, pipeline: CompletionPipeline, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """_update_pm never raises — best-effort only."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
+        monkeypatch.setenv("PLANE_API_KEY", "fake-key")
         result = CompletionResult(
             ticket_id="IMP-1",
             passed=True,
@@ -305,22 +322,18 @@ class TestUpdatePm:
             commit_hash=None,
         )
 
-        import os
+        monkeypatch.setattr(pipeline, "_plane_adapter_cls", _FailingAdapter)
 
-        os.environ["PLANE_API_KEY"] = "fake-key"
-        try:
-            with patch("imp.pm.plane.PlaneAdapter") as mock_adapter_cls:
-                mock_adapter_cls.return_value.add_comment.side_effect = RuntimeError("PM failure")
-                # Should NOT raise
-                outcome = pipeline._update_pm("IMP-1", result)
-        finally:
-            del os.environ["PLANE_API_KEY"]
+        # Should NOT raise
+        outcome = pipeline._update_pm("IMP-1", result)
 
         assert outcome is False
 
-    def test_update_pm_returns_true_on_success(self, tmp_path: Path) -> None:
+    def test_update_pm_returns_true_on_success(
+        self, pipeline: CompletionPipeline, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """_update_pm returns True when PlaneAdapter.add_comment succeeds."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
+        monkeypatch.setenv("PLANE_API_KEY", "fake-key")
         result = CompletionResult(
             ticket_id="IMP-1",
             passed=True,
@@ -328,21 +341,20 @@ class TestUpdatePm:
             commit_hash="abc1234",
         )
 
-        import os
+        monkeypatch.setattr(pipeline, "_plane_adapter_cls", _StubAdapter)
+        _StubAdapter.comments.clear()
 
-        os.environ["PLANE_API_KEY"] = "fake-key"
-        try:
-            with (
-                patch("imp.pm.models.PlaneConfig"),
-                patch("imp.pm.plane.PlaneAdapter") as mock_adapter_cls,
-            ):
-                mock_adapter_cls.return_value.add_comment.return_value = None
-                outcome = pipeline._update_pm("IMP-1", result)
-        finally:
-            del os.environ["PLANE_API_KEY"]
+        outcome = pipeline._update_pm("IMP-1", result)
 
         assert outcome is True
-        mock_adapter_cls.return_value.add_comment.assert_called_once()
+        assert _StubAdapter.comments == [("IMP-1", "imp code done: ticket=IMP-1 status=done")]
+
+    def test_default_adapter_is_plane(self) -> None:
+        """Without an injected adapter, _update_pm resolves PlaneAdapter lazily."""
+        from imp.pm.plane import PlaneAdapter
+
+        assert CompletionPipeline._plane_adapter_cls is None
+        assert _import_plane_adapter() is PlaneAdapter
 
 
 # ---------------------------------------------------------------------------
@@ -350,221 +362,84 @@ class TestUpdatePm:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="pipeline_run")
 class TestCompletionPipelineRun:
     """Test CompletionPipeline.run full workflow."""
 
-    def test_successful_completion_check_then_review_then_commit(self, tmp_path: Path) -> None:
-        """Successful run: check passes, review passes, commit succeeds."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
+    @pytest.mark.parametrize("pm_ok", [True, False], ids=["pm-updated", "pm-failed"])
+    def test_successful_run(
+        self, fake_root: Path, pipeline: CompletionPipeline, pm_ok: bool
+    ) -> None:
+        """check → review → commit → PM update; PM failure never changes the result."""
         session = _make_session()
-        expected_wt = tmp_path / session.worktree_path
-
-        with (
-            patch.object(pipeline, "_run_check", return_value=(True, "ok")) as mock_check,
-            patch.object(
-                pipeline, "_run_review", return_value=(True, '{"passed":true}')
-            ) as mock_review,
-            patch.object(pipeline, "_commit_changes", return_value="abc1234") as mock_commit,
-            patch.object(pipeline, "_update_pm", return_value=True),
-        ):
+        expected_wt = fake_root / session.worktree_path
+
+        with _patched_helpers(pipeline, pm=pm_ok) as mocks:
             result = pipeline.run(session)
 
-        mock_check.assert_called_once_with(expected_wt)
-        mock_review.assert_called_once_with(expected_wt)
-        mock_commit.assert_called_once()
+        mocks["_run_check"].assert_called_once_with(expected_wt)
+        mocks["_run_review"].assert_called_once_with(expected_wt)
+        mocks["_commit_changes"].assert_called_once_with(expected_wt, session.ticket_id)
+        mocks["_update_pm"].assert_called_once()
         assert result.passed is True
         assert result.exit_code == 0
         assert result.commit_hash == "abc1234"
-
-    def test_result_includes_all_attempts_in_history(self, tmp_path: Path) -> None:
-        """Result has attempt history even on first-try success."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        session = _make_session()
-
-        with (
-            patch.object(pipeline, "_run_check", return_value=(True, "ok")),
-            patch.object(pipeline, "_run_review", return_value=(True, "{}")),
-            patch.object(pipeline, "_commit_changes", return_value="abc"),
-            patch.object(pipeline, "_update_pm", return_value=True),
-        ):
-            result = pipeline.run(session)
-
-        assert isinstance(result.attempts, list)
-        assert len(result.attempts) >= 1
-
-    def test_session_status_updated_to_done_on_success(self, tmp_path: Path) -> None:
-        """Session status is set to done when pipeline completes successfully."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        session = _make_session()
-
-        with (
-            patch.object(pipeline, "_run_check", return_value=(True, "ok")),
-            patch.object(pipeline, "_run_review", return_value=(True, "{}")),
-            patch.object(pipeline, "_commit_changes", return_value="abc"),
-            patch.object(pipeline, "_update_pm", return_value=True),
-        ):
-            pipeline.run(session)
-
+        assert result.pm_updated is pm_ok
+        assert len(result.attempts) == 1
         assert session.status == SessionStatus.done
 
-    def test_commit_only_happens_after_check_and_review_pass(self, tmp_path: Path) -> None:
+    def test_commit_only_happens_after_check_and_review_pass(
+        self, pipeline: CompletionPipeline
+    ) -> None:
         """Commit is NOT called when check or review fails."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        session = _make_session()
+        with _patched_helpers(pipeline, check=(False, "lint error")) as mocks:
+            pipeline.run(_make_session())
 
-        with (
-            patch.object(pipeline, "_run_check", return_value=(False, "lint error")),
-            patch.object(pipeline, "_run_review") as mock_review,
-            patch.object(pipeline, "_commit_changes") as mock_commit,
-            patch.object(pipeline, "_update_pm", return_value=False),
-        ):
-            pipeline.run(session)
+        mocks["_run_review"].assert_not_called()
+        mocks["_commit_changes"].assert_not_called()
 
-        mock_review.assert_not_called()
-        mock_commit.assert_not_called()
-
-    def test_review_finding_issues_returns_exit_code_1(self, tmp_path: Path) -> None:
+    def test_review_finding_issues_returns_exit_code_1(self, pipeline: CompletionPipeline) -> None:
         """When review finds issues, result has exit_code=1."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        session = _make_session()
+        with _patched_helpers(pipeline, review=(False, '{"passed":false}')) as mocks:
+            result = pipeline.run(_make_session())
 
-        with (
-            patch.object(pipeline, "_run_check", return_value=(True, "ok")),
-            patch.object(pipeline, "_run_review", return_value=(False, '{"passed":false}')),
-            patch.object(pipeline, "_commit_changes") as mock_commit,
-            patch.object(pipeline, "_update_pm", return_value=False),
-        ):
-            result = pipeline.run(session)
-
-        mock_commit.assert_not_called()
+        mocks["_commit_changes"].assert_not_called()
         assert result.exit_code == 1
         assert result.passed is False
 
-    def test_pm_update_failure_does_not_affect_result(self, tmp_path: Path) -> None:
-        """PM update failure doesn't change the pipeline result."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        session = _make_session()
-
-        with (
-            patch.object(pipeline, "_run_check", return_value=(True, "ok")),
-            patch.object(pipeline, "_run_review", return_value=(True, "{}")),
-            patch.object(pipeline, "_commit_changes", return_value="abc"),
-            patch.object(pipeline, "_update_pm", return_value=False),  # PM fails
-        ):
-            result = pipeline.run(session)
-
-        assert result.passed is True
-        assert result.exit_code == 0
-
-    def test_pm_update_is_called_after_success(self, tmp_path: Path) -> None:
-        """PM update is attempted after successful check + review + commit."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        session = _make_session()
-
-        with (
-            patch.object(pipeline, "_run_check", return_value=(True, "ok")),
-            patch.object(pipeline, "_run_review", return_value=(True, "{}")),
-            patch.object(pipeline, "_commit_changes", return_value="abc"),
-            patch.object(pipeline, "_update_pm") as mock_pm,
-        ):
-            mock_pm.return_value = True
-            pipeline.run(session)
-
-        mock_pm.assert_called_once()
-
 
 # ---------------------------------------------------------------------------
 # Circuit breaker
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="pipeline_circuit_breaker")
 class TestCircuitBreaker:
-    """Test circuit breaker: 3 check failures → escalate."""
-
-    def test_check_failure_increments_attempt_count(self, tmp_path: Path) -> None:
-        """Each failed check increments the attempt counter."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        session = _make_session()
-
-        call_count = 0
-
-        def _check_always_fail(worktree: Path) -> tuple[bool, str]:
-            nonlocal call_count
-            call_count += 1
-            return (False, f"fail #{call_count}")
-
-        with (
-            patch.object(pipeline, "_run_check", side_effect=_check_always_fail),
-            patch.object(pipeline, "_run_review") as mock_review,
-            patch.object(pipeline, "_commit_changes") as mock_commit,
-            patch.object(pipeline, "_update_pm", return_value=False),
-        ):
-            pipeline.run(session)
-
-        # Circuit breaks after max_retries (3) — review and commit never called
-        mock_review.assert_not_called()
-        mock_commit.assert_not_called()
-        assert call_count == 3
-
-    def test_circuit_breaker_three_failures_escalates(self, tmp_path: Path) -> None:
-        """After 3 check failures the result is escalated."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
+    """Test circuit breaker: max_retries check failures → escalate."""
+
+    @pytest.mark.parametrize("max_retries", [1, 2])
+    def test_check_failures_escalate(
+        self,
+        pipeline: CompletionPipeline,
+        monkeypatch: pytest.MonkeyPatch,
+        max_retries: int,
+    ) -> None:
+        """max_retries check failures → escalated result, no review or commit."""
+        monkeypatch.setattr(pipeline, "max_retries", max_retries)
         session = _make_session()
+        outputs = iter(f"fail #{n}" for n in range(1, max_retries + 1))
 
-        with (
-            patch.object(pipeline, "_run_check", return_value=(False, "error")),
-            patch.object(pipeline, "_run_review"),
-            patch.object(pipeline, "_commit_changes"),
-            patch.object(pipeline, "_update_pm", return_value=False),
-        ):
+        with _patched_helpers(pipeline) as mocks:
+            mocks["_run_check"].side_effect = lambda _wt: (False, next(outputs))
             result = pipeline.run(session)
 
-        assert result.exit_code == 2
-
-    def test_escalated_result_has_exit_code_2(self, tmp_path: Path) -> None:
-        """Escalated CompletionResult has exit_code == 2."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        session = _make_session()
-
-        with (
-            patch.object(pipeline, "_run_check", return_value=(False, "error")),
-            patch.object(pipeline, "_run_review"),
-            patch.object(pipeline, "_commit_changes"),
-            patch.object(pipeline, "_update_pm", return_value=False),
-        ):
-            result = pipeline.run(session)
-
-        assert result.exit_code == 2
+        assert mocks["_run_check"].call_count == max_retries
+        mocks["_run_review"].assert_not_called()
+        mocks["_commit_changes"].assert_not_called()
         assert result.passed is False
-
-    def test_session_status_updated_to_escalated_on_circuit_break(self, tmp_path: Path) -> None:
-        """Session status becomes escalated when circuit breaker fires."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        session = _make_session()
-
-        with (
-            patch.object(pipeline, "_run_check", return_value=(False, "error")),
-            patch.object(pipeline, "_run_review"),
-            patch.object(pipeline, "_commit_changes"),
-            patch.object(pipeline, "_update_pm", return_value=False),
-        ):
-            pipeline.run(session)
-
+        assert result.escalated is True
+        assert result.exit_code == 2
         assert session.status == SessionStatus.escalated
-
-    def test_attempt_history_recorded_for_each_failure(self, tmp_path: Path) -> None:
-        """Each attempt is recorded in result.attempts."""
-        pipeline = CompletionPipeline(project_root=tmp_path)
-        session = _make_session()
-
-        with (
-            patch.object(pipeline, "_run_check", return_value=(False, "error")),
-            patch.object(pipeline, "_run_review"),
-            patch.object(pipeline, "_commit_changes"),
-            patch.object(pipeline, "_update_pm", return_value=False),
-        ):
-            result = pipeline.run(session)
-
-        assert len(result.attempts) == pipeline.max_retries
-        for attempt in result.attempts:
-            assert isinstance(attempt, CompletionAttempt)
+        assert [a.attempt_number for a in result.attempts] == list(range(1, max_retries + 1))
+        assert all(isinstance(a, CompletionAttempt) for a in result.attempts)
+        assert result.attempts[-1].check_output == f"fail #{max_retries}"
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import contextlib
+import json
+import sqlite3
+from collections.abc import Iterator
 from pathlib import Path
 
-from imp.executor.models import ContextBudget, SessionStatus, WorktreeSession
+import pytest
+
+from imp.executor.models import SessionStatus, WorktreeSession
 from imp.executor.session import SessionStore
 
 
@@ -14,105 +19,34 @@ def _make_session(ticket_id: str = "IMP-001", title: str = "Test ticket") -> Wor
     return WorktreeSession(ticket_id=ticket_id, title=title)
 
 
-class TestSessionStoreSaveLoad:
-    """Test save and load roundtrip."""
-
-    def test_save_and_load_roundtrip(self, tmp_path: Path) -> None:
-        """Saving and loading a session preserves all fields."""
-        store = SessionStore(tmp_path)
-        session = _make_session("IMP-001", "Roundtrip test")
-        store.save(session)
-
-        loaded = store.load("IMP-001")
-        assert loaded is not None
-        assert loaded.ticket_id == "IMP-001"
-        assert loaded.title == "Roundtrip test"
-
-    def test_save_preserves_status(self, tmp_path: Path) -> None:
-        """Saving preserves status field."""
-        store = SessionStore(tmp_path)
-        session = _make_session("IMP-001")
-        session.status = SessionStatus.done
-        store.save(session)
-
-        loaded = store.load("IMP-001")
-        assert loaded is not None
-        assert loaded.status == SessionStatus.done
-
-    def test_save_preserves_attempt_count(self, tmp_path: Path) -> None:
-        """Saving preserves attempt_count field."""
-        store = SessionStore(tmp_path)
-        session = _make_session("IMP-001")
-        session.attempt_count = 2
-        store.save(session)
-
-        loaded = store.load("IMP-001")
-        assert loaded is not None
-        assert loaded.attempt_count == 2
-
-    def test_save_preserves_description(self, tmp_path: Path) -> None:
-        """Saving preserves description field."""
-        store = SessionStore(tmp_path)
-        session = WorktreeSession(
-            ticket_id="IMP-001",
-            title="Test",
-            description="A detailed description",
-        )
-        store.save(session)
-
-        loaded = store.load("IMP-001")
-        assert loaded is not None
-        assert loaded.description == "A detailed description"
-
-    def test_save_preserves_branch(self, tmp_path: Path) -> None:
-        """Saving preserves computed branch field."""
-        store = SessionStore(tmp_path)
-        session = _make_session("IMP-005")
-        store.save(session)
+@pytest.fixture(scope="class")
+def class_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One project root per test class, sharing one sessions database."""
+    return tmp_path_factory.mktemp("sessions")
 
-        loaded = store.load("IMP-005")
-        assert loaded is not None
-        assert loaded.branch == "imp/IMP-005"
 
-    def test_save_preserves_worktree_path(self, tmp_path: Path) -> None:
-        """Saving preserves computed worktree_path field."""
-        store = SessionStore(tmp_path)
-        session = _make_session("IMP-007")
-        store.save(session)
+@pytest.fixture
+def store(class_root: Path) -> Iterator[SessionStore]:
+    """SessionStore on the class root; saved sessions are removed after each test."""
+    with SessionStore(class_root) as session_store:
+        yield session_store
+        for session in session_store.list_sessions():
+            session_store.delete(session.ticket_id)
 
-        loaded = store.load("IMP-007")
-        assert loaded is not None
-        assert loaded.worktree_path == ".trees/IMP-007"
-
-    def test_save_preserves_context_budget(self, tmp_path: Path) -> None:
-        """Saving preserves context_budget field."""
-        store = SessionStore(tmp_path)
-        session = WorktreeSession(
-            ticket_id="IMP-001",
-            title="Test",
-            context_budget=ContextBudget(used_tokens=12_000),
-        )
-        store.save(session)
 
-        loaded = store.load("IMP-001")
-        assert loaded is not None
-        assert loaded.context_budget.used_tokens == 12_000
+class TestSessionStoreSaveLoad:
+    """Test save and load roundtrip."""
 
-    def test_save_preserves_created_at(self, tmp_path: Path) -> None:
-        """Saving preserves created_at timestamp."""
-        store = SessionStore(tmp_path)
-        created = datetime.now(UTC)
-        session = WorktreeSession(ticket_id="IMP-001", title="Test", created_at=created)
+    def test_save_and_load_roundtrip(self, store: SessionStore) -> None:
+        """Saving and loading a session preserves all fields."""
+        session = _make_session("IMP-001", "Roundtrip test")
         store.save(session)
 
         loaded = store.load("IMP-001")
-        assert loaded is not None
-        # Compare by isoformat string to avoid microsecond drift
-        assert loaded.created_at.isoformat() == created.isoformat()
+        assert loaded == session
 
-    def test_overwrite_existing_session(self, tmp_path: Path) -> None:
+    def test_overwrite_existing_session(self, store: SessionStore) -> None:
         """Saving the same ticket_id overwrites the existing session."""
-        store = SessionStore(tmp_path)
         session = _make_session("IMP-001")
         store.save(session)
 
@@ -129,36 +63,31 @@ class TestSessionStoreSaveLoad:
 class TestSessionStoreLoad:
     """Test load behavior for missing sessions."""
 
-    def test_load_returns_none_for_nonexistent(self, tmp_path: Path) -> None:
+    def test_load_returns_none_for_nonexistent(self, store: SessionStore) -> None:
         """load() returns None for a ticket_id that does not exist."""
-        store = SessionStore(tmp_path)
         assert store.load("IMP-MISSING") is None
 
-    def test_load_returns_none_when_store_empty(self, tmp_path: Path) -> None:
+    def test_load_returns_none_when_store_empty(self, store: SessionStore) -> None:
         """load() returns None when no sessions have been saved."""
-        store = SessionStore(tmp_path)
         assert store.load("IMP-001") is None
 
 
 class TestSessionStoreList:
     """Test list_sessions behavior."""
 
-    def test_list_sessions_empty(self, tmp_path: Path) -> None:
+    def test_list_sessions_empty(self, store: SessionStore) -> None:
         """list_sessions() returns empty list when no sessions saved."""
-        store = SessionStore(tmp_path)
         assert store.list_sessions() == []
 
-    def test_list_sessions_single(self, tmp_path: Path) -> None:
+    def test_list_sessions_single(self, store: SessionStore) -> None:
         """list_sessions() returns one session after one save."""
-        store = SessionStore(tmp_path)
         store.save(_make_session("IMP-001"))
         sessions = store.list_sessions()
         assert len(sessions) == 1
         assert sessions[0].ticket_id == "IMP-001"
 
-    def test_list_sessions_multiple(self, tmp_path: Path) -> None:
+    def test_list_sessions_multiple(self, store: SessionStore) -> None:
         """list_sessions() returns all saved sessions."""
-        store = SessionStore(tmp_path)
         store.save(_make_session("IMP-001"))
         store.save(_make_session("IMP-002"))
         store.save(_make_session("IMP-003"))
@@ -167,40 +96,83 @@ class TestSessionStoreList:
         ticket_ids = {s.ticket_id for s in sessions}
         assert ticket_ids == {"IMP-001", "IMP-002", "IMP-003"}
 
-    def test_list_sessions_returns_worktree_session_instances(self, tmp_path: Path) -> None:
+    def test_list_sessions_returns_worktree_session_instances(self, store: SessionStore) -> None:
         """list_sessions() returns WorktreeSession instances."""
-        store = SessionStore(tmp_path)
         store.save(_make_session("IMP-001"))
         sessions = store.list_sessions()
         assert all(isinstance(s, WorktreeSession) for s in sessions)
 
 
+class TestSessionStoreListTicketIds:
+    """Test list_ticket_ids behavior."""
+
+    def test_list_ticket_ids_empty(self, store: SessionStore) -> None:
+        """list_ticket_ids() returns empty list when no sessions saved."""
+        assert store.list_ticket_ids() == []
+
+    def test_list_ticket_ids_matches_list_sessions(self, store: SessionStore) -> None:
+        """list_ticket_ids() returns the ids of list_sessions(), in the same order."""
+        store.save_many(_make_session(ticket_id) for ticket_id in ("IMP-002", "IMP-001"))
+
+        assert store.list_ticket_ids() == ["IMP-002", "IMP-001"]
+        assert store.list_ticket_ids() == [s.ticket_id for s in store.list_sessions()]
+
+
+class TestSessionStoreSaveMany:
+    """Test bulk saves."""
+
+    def test_save_many_saves_all(self, store: SessionStore) -> None:
+        """save_many() persists every session it is given."""
+        store.save_many(_make_session(f"IMP-00{i}") for i in range(1, 4))
+        assert [s.ticket_id for s in store.list_sessions()] == ["IMP-001", "IMP-002", "IMP-003"]
+
+    def test_save_many_overwrites_existing(self, store: SessionStore) -> None:
+        """save_many() replaces sessions that were already saved."""
+        store.save(_make_session("IMP-001", "Old"))
+        store.save_many([_make_session("IMP-001", "New"), _make_session("IMP-002")])
+
+        loaded = store.load("IMP-001")
+        assert loaded is not None
+        assert loaded.title == "New"
+        assert len(store.list_sessions()) == 2
+
+    def test_save_many_empty_is_noop(self, store: SessionStore) -> None:
+        """save_many() with no sessions writes nothing."""
+        store.save_many([])
+        assert store.list_sessions() == []
+
+    def test_save_many_rolls_back_on_failure(self, store: SessionStore) -> None:
+        """A failing row leaves none of the batch behind."""
+        broken = _make_session("IMP-002")
+        broken.ticket_id = None  # type: ignore[assignment]  # violates the primary key's NOT NULL
+
+        with pytest.raises(sqlite3.IntegrityError):
+            store.save_many([_make_session("IMP-001"), broken])
+        assert store.list_sessions() == []
+
+
 class TestSessionStoreDelete:
     """Test delete behavior."""
 
-    def test_delete_removes_session(self, tmp_path: Path) -> None:
+    def test_delete_removes_session(self, store: SessionStore) -> None:
         """delete() removes the session so it can no longer be loaded."""
-        store = SessionStore(tmp_path)
         store.save(_make_session("IMP-001"))
         store.delete("IMP-001")
         assert store.load("IMP-001") is None
 
-    def test_delete_returns_true_when_existed(self, tmp_path: Path) -> None:
+    def test_delete_returns_true_when_existed(self, store: SessionStore) -> None:
         """delete() returns True when the session existed."""
-        store = SessionStore(tmp_path)
         store.save(_make_session("IMP-001"))
         result = store.delete("IMP-001")
         assert result is True
 
-    def test_delete_returns_false_for_nonexistent(self, tmp_path: Path) -> None:
+    def test_delete_returns_false_for_nonexistent(self, store: SessionStore) -> None:
         """delete() returns False when session does not exist."""
-        store = SessionStore(tmp_path)
         result = store.delete("IMP-MISSING")
         assert result is False
 
-    def test_delete_does_not_affect_other_sessions(self, tmp_path: Path) -> None:
+    def test_delete_does_not_affect_other_sessions(self, store: SessionStore) -> None:
         """delete() only removes the specified session."""
-        store = SessionStore(tmp_path)
         store.save(_make_session("IMP-001"))
         store.save(_make_session("IMP-002"))
         store.delete("IMP-001")
@@ -212,54 +184,141 @@ class TestSessionStoreDelete:
 class TestSessionStoreExists:
     """Test exists behavior."""
 
-    def test_exists_true_when_saved(self, tmp_path: Path) -> None:
+    def test_exists_true_when_saved(self, store: SessionStore) -> None:
         """exists() returns True after session is saved."""
-        store = SessionStore(tmp_path)
         store.save(_make_session("IMP-001"))
         assert store.exists("IMP-001") is True
 
-    def test_exists_false_when_not_saved(self, tmp_path: Path) -> None:
+    def test_exists_false_when_not_saved(self, store: SessionStore) -> None:
         """exists() returns False when no session has been saved."""
-        store = SessionStore(tmp_path)
         assert store.exists("IMP-001") is False
 
-    def test_exists_false_after_delete(self, tmp_path: Path) -> None:
+    def test_exists_false_after_delete(self, store: SessionStore) -> None:
         """exists() returns False after the session is deleted."""
-        store = SessionStore(tmp_path)
         store.save(_make_session("IMP-001"))
         store.delete("IMP-001")
         assert store.exists("IMP-001") is False
 
 
-class TestSessionStoreDirectoryCreation:
-    """Test directory auto-creation behavior."""
-
-    def test_sessions_dir_created_on_first_save(self, tmp_path: Path) -> None:
-        """The .imp/sessions/ directory is auto-created on first save."""
-        store = SessionStore(tmp_path)
-        sessions_dir = tmp_path / ".imp" / "sessions"
-        assert not sessions_dir.exists()
-
-        store.save(_make_session("IMP-001"))
-        assert sessions_dir.exists()
-        assert sessions_dir.is_dir()
-
-    def test_saves_to_correct_path(self, tmp_path: Path) -> None:
-        """Session is saved to .imp/sessions/{ticket_id}.json."""
-        store = SessionStore(tmp_path)
-        store.save(_make_session("IMP-042"))
-
-        expected_path = tmp_path / ".imp" / "sessions" / "IMP-042.json"
-        assert expected_path.exists()
-
-    def test_json_file_is_valid(self, tmp_path: Path) -> None:
-        """The saved JSON file is valid and parseable."""
-        import json
-
-        store = SessionStore(tmp_path)
-        store.save(_make_session("IMP-001"))
+class TestSessionStoreDatabase:
+    """Test the on-disk database and its lifecycle."""
+
+    def test_database_created_on_first_save(self, tmp_path: Path) -> None:
+        """.imp/sessions.db is created by the first save."""
+        db_path = tmp_path / ".imp" / "sessions.db"
+        with SessionStore(tmp_path) as store:
+            assert not db_path.exists()
+            store.save(_make_session("IMP-001"))
+        assert db_path.is_file()
+
+    def test_reads_do_not_create_database(self, tmp_path: Path) -> None:
+        """Reads on a fresh project return empty results without creating .imp/."""
+        with SessionStore(tmp_path) as store:
+            assert store.list_sessions() == []
+            assert store.list_ticket_ids() == []
+            assert store.load("IMP-001") is None
+            assert store.exists("IMP-001") is False
+            assert store.delete("IMP-001") is False
+        assert not (tmp_path / ".imp").exists()
+
+    def test_payload_is_session_json(self, tmp_path: Path) -> None:
+        """Each row stores the session's JSON keyed by ticket_id."""
+        with SessionStore(tmp_path) as store:
+            store.save(_make_session("IMP-042"))
+
+        with contextlib.closing(sqlite3.connect(tmp_path / ".imp" / "sessions.db")) as conn:
+            rows = conn.execute("SELECT ticket_id, payload FROM sessions").fetchall()
+        [(ticket_id, payload)] = rows
+        assert ticket_id == "IMP-042"
+        assert json.loads(payload)["ticket_id"] == "IMP-042"
+
+    def test_list_sessions_in_save_order(self, tmp_path: Path) -> None:
+        """list_sessions() keeps first-save order, even after an overwrite."""
+        with SessionStore(tmp_path) as store:
+            for ticket_id in ("IMP-003", "IMP-001", "IMP-002"):
+                store.save(_make_session(ticket_id))
+            store.save(_make_session("IMP-003", "Renamed"))
+
+            sessions = store.list_sessions()
+        assert [s.ticket_id for s in sessions] == ["IMP-003", "IMP-001", "IMP-002"]
+        assert sessions[0].title == "Renamed"
+
+    def test_persists_across_store_instances(self, tmp_path: Path) -> None:
+        """A new SessionStore on the same root sees earlier saves."""
+        with SessionStore(tmp_path) as store:
+            store.save(_make_session("IMP-001"))
+        with SessionStore(tmp_path) as store:
+            assert store.exists("IMP-001") is True
+
+    def test_imports_legacy_json_sessions(self, tmp_path: Path) -> None:
+        """Sessions saved as .imp/sessions/*.json are imported when the database is created."""
+        legacy_dir = tmp_path / ".imp" / "sessions"
+        legacy_dir.mkdir(parents=True)
+        legacy = _make_session("IMP-007", "Legacy")
+        (legacy_dir / "IMP-007.json").write_text(legacy.model_dump_json(), encoding="utf-8")
+
+        with SessionStore(tmp_path) as store:
+            assert store.load("IMP-007") == legacy
+
+    def test_legacy_json_ignored_once_database_exists(self, tmp_path: Path) -> None:
+        """Legacy files are only imported by the store that creates the database."""
+        with SessionStore(tmp_path) as store:
+            store.save(_make_session("IMP-001"))
+        legacy_dir = tmp_path / ".imp" / "sessions"
+        legacy_dir.mkdir()
+        (legacy_dir / "IMP-007.json").write_text(
+            _make_session("IMP-007").model_dump_json(), encoding="utf-8"
+        )
 
-        json_path = tmp_path / ".imp" / "sessions" / "IMP-001.json"
-        content = json_path.read_text()
-        data = json.loads(content)
-        assert data["ticket_id"] == "IMP-001"
+        with SessionStore(tmp_path) as store:
+            assert store.exists("IMP-007") is False
+
+    def test_invalid_legacy_json_skipped(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Legacy files that no longer validate are skipped with a warning; the rest import."""
+        legacy_dir = tmp_path / ".imp" / "sessions"
+        legacy_dir.mkdir(parents=True)
+        payload = json.loads(_make_session("IMP-008").model_dump_json())
+        (legacy_dir / "bad.json").write_text(
+            json.dumps({**payload, "ticket_id": "../bad"}), encoding="utf-8"
+        )
+        (legacy_dir / "IMP-008.json").write_text(json.dumps(payload), encoding="utf-8")
+
+        with (
+            caplog.at_level("WARNING", logger="imp.executor.session"),
+            SessionStore(tmp_path) as store,
+        ):
+            assert store.list_ticket_ids() == ["IMP-008"]
+        with SessionStore(tmp_path) as store:
+            assert store.list_ticket_ids() == ["IMP-008"]
+
+        [record] = caplog.records
+        assert "bad.json" in record.getMessage()
+        assert (legacy_dir / "bad.json").exists()
+
+    def test_failed_legacy_import_is_retried(self, tmp_path: Path) -> None:
+        """An import that fails part-way commits nothing and runs again on the next open."""
+        legacy_dir = tmp_path / ".imp" / "sessions"
+        legacy_dir.mkdir(parents=True)
+        (legacy_dir / "IMP-007.json").write_text(
+            _make_session("IMP-007").model_dump_json(), encoding="utf-8"
+        )
+        unreadable = legacy_dir / "IMP-009.json"
+        unreadable.mkdir()
+
+        with SessionStore(tmp_path) as store, pytest.raises(OSError):
+            store.list_sessions()
+        unreadable.rmdir()
+
+        with SessionStore(tmp_path) as store:
+            assert store.list_ticket_ids() == ["IMP-007"]
+
+    def test_close_is_idempotent_and_store_reopens(self, tmp_path: Path) -> None:
+        """close() can be called repeatedly; the next operation reopens the database."""
+        with SessionStore(tmp_path) as store:
+            store.close()
+            store.save(_make_session("IMP-001"))
+            store.close()
+            store.close()
+            assert store.exists("IMP-001") is True
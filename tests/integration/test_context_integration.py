@@ -1,20 +1,22 @@
 """Integration tests for context module — full pipeline tests."""
 
-import json
+from __future__ import annotations
+
 from pathlib import Path
 
+import pytest
 
-def test_full_pipeline_python_project(tmp_path: Path) -> None:
-    """Test full L1+L2+indexing pipeline on a Python project."""
-    from imp.context.indexer import generate_indexes, save_cache
-    from imp.context.parser import scan_and_parse
+from imp.context import cli as context_cli
+from imp.context.cli import _run_init, init_command
+from imp.context.indexer import generate_indexes, save_cache
+from imp.context.models import ProjectScan
+from imp.context.parser import scan_and_parse
+from imp.context.staleness import detect_stale_modules
+from imp.context.summary_cache import load_summaries
+from imp.types import TokenUsage
 
-    # Create a multi-file Python project
-    src_dir = tmp_path / "src"
-    src_dir.mkdir()
-
-    # Create module with functions and classes
-    (src_dir / "core.py").write_text("""
+# Python sources for the sample projects, encoded once at import.
+_CORE_PY = b"""
 def hello() -> str:
     \"\"\"Say hello.\"\"\"
     return "Hello"
@@ -25,20 +27,98 @@ class Greeter:
     def greet(self, name: str) -> str:
         \"\"\"Greet someone.\"\"\"
         return f"Hello, {name}"
-""")
+"""
 
-    # Create another module
-    (src_dir / "utils.py").write_text("""
+_UTILS_PY = b"""
 from typing import List
 
 def process_items(items: List[str]) -> None:
     \"\"\"Process items.\"\"\"
     for item in items:
         print(item)
-""")
+"""
 
-    # Scan and parse (L1+L2)
-    scan_result = scan_and_parse(tmp_path)
+_MAIN_PY = b"""
+def main() -> None:
+    print("Hello")
+"""
+
+_TEST_MAIN_PY = b"""
+def test_main() -> None:
+    assert True
+"""
+
+_CALCULATOR_PY = b"""
+\"\"\"A test module.\"\"\"
+
+class Calculator:
+    \"\"\"A calculator class.\"\"\"
+
+    def add(self, a: int, b: int) -> int:
+        \"\"\"Add two numbers.\"\"\"
+        return a + b
+
+    def subtract(self, a: int, b: int) -> int:
+        \"\"\"Subtract two numbers.\"\"\"
+        return a - b
+
+def standalone_function() -> None:
+    \"\"\"A standalone function.\"\"\"
+    pass
+"""
+
+_BAD_PY = b"""
+def broken(
+    # Missing closing paren and body
+"""
+
+_PROCESSOR_PY = b"""
+def process() -> None:
+    \"\"\"Process data.\"\"\"
+    pass
+
+class Processor:
+    \"\"\"Main processor.\"\"\"
+    def run(self) -> None:
+        pass
+"""
+
+_TEST_CORE_PY = b"""
+def test_process() -> None:
+    assert True
+"""
+
+_FAKE_USAGE = TokenUsage(input_tokens=100, output_tokens=20, total_tokens=120)
+
+
+async def _fake_invoke(prompt: str) -> tuple[str, TokenUsage]:
+    """Stand-in AI provider: the same summary for every module."""
+    return "Module handles core logic.", _FAKE_USAGE
+
+
+def _write_tree(root: Path, tree: dict[str, bytes]) -> None:
+    """Write ``tree`` (relative path -> contents) under ``root``, creating each parent once."""
+    for parent in {(root / rel).parent for rel in tree}:
+        parent.mkdir(parents=True, exist_ok=True)
+    for rel, data in tree.items():
+        (root / rel).write_bytes(data)
+
+
+@pytest.fixture(scope="module")
+def sample_python_project(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, ProjectScan]:
+    """A two-file Python project, written and scanned (L1+L2) once per module.
+
+    Tests may add indexes and caches under the root but must not change its sources.
+    """
+    root = tmp_path_factory.mktemp("python_project")
+    _write_tree(root, {"src/core.py": _CORE_PY, "src/utils.py": _UTILS_PY})
+    return root, scan_and_parse(root)
+
+
+def test_full_pipeline_python_project(sample_python_project: tuple[Path, ProjectScan]) -> None:
+    """Test full L1+L2+indexing pipeline on a Python project."""
+    tmp_path, scan_result = sample_python_project
+    src_dir = tmp_path / "src"
 
     # Verify scan result
     assert scan_result.project_root == str(tmp_path)
@@ -53,76 +133,40 @@ def process_items(items: List[str]) -> None:
     # Verify root .index.md exists
     root_index = tmp_path / ".index.md"
     assert root_index.exists()
-    content = root_index.read_text()
+    content = root_index.read_bytes()
     # Root index should list modules with stats
-    assert "src" in content or str(src_dir) in content
-    assert "2" in content  # 2 files or 2 functions
+    assert b"src" in content
+    assert b"2" in content  # 2 files or 2 functions
 
     # Verify module .index.md exists
     module_index = src_dir / ".index.md"
     assert module_index.exists()
-    module_content = module_index.read_text()
+    module_content = module_index.read_bytes()
 
     # Should mention the files
-    assert "core.py" in module_content or "utils.py" in module_content
+    assert b"core.py" in module_content or b"utils.py" in module_content
 
     # Save cache
     save_cache(scan_result, tmp_path)
     cache_file = tmp_path / ".imp" / "scan.json"
     assert cache_file.exists()
 
-    # Verify cache is valid JSON and contains expected data
-    cache_data = json.loads(cache_file.read_text())
-    assert cache_data["project_type"] == "python"
-    assert cache_data["total_files"] == 2
-
-
-def test_full_pipeline_empty_project(tmp_path: Path) -> None:
-    """Test full pipeline on an empty project."""
-    from imp.context.indexer import generate_indexes
-    from imp.context.parser import scan_and_parse
+    # Verify cache is a valid ProjectScan and contains expected data
+    cached = ProjectScan.model_validate_json(cache_file.read_bytes())
+    assert cached.project_type == "python"
+    assert cached.total_files == 2
 
-    # Empty directory
-    scan_result = scan_and_parse(tmp_path)
-
-    # Should succeed with zero files
-    assert scan_result.total_files == 0
-    assert scan_result.total_functions == 0
-    assert scan_result.total_classes == 0
-
-    # Generate indexes (should create root index even if empty)
-    generate_indexes(scan_result, tmp_path)
 
-    # Verify root .index.md exists
-    root_index = tmp_path / ".index.md"
-    assert root_index.exists()
-
-    # Content should indicate empty project or have empty tables
-    content = root_index.read_text()
-    assert len(content) > 0
-
-
-def test_round_trip_serialization(tmp_path: Path) -> None:
+def test_round_trip_serialization(sample_python_project: tuple[Path, ProjectScan]) -> None:
     """Test that scan results can be saved and loaded."""
-    from imp.context.indexer import save_cache
-    from imp.context.models import ProjectScan
-    from imp.context.parser import scan_and_parse
-
-    # Create a simple Python project
-    (tmp_path / "test.py").write_text("def foo(): pass")
-
-    # Scan and parse
-    original_scan = scan_and_parse(tmp_path)
+    tmp_path, original_scan = sample_python_project
 
     # Save to cache
     save_cache(original_scan, tmp_path)
 
-    # Load from JSON
+    # Deserialize the JSON cache back to ProjectScan
     cache_file = tmp_path / ".imp" / "scan.json"
-    cache_json = json.loads(cache_file.read_text())
-
-    # Deserialize back to ProjectScan
-    loaded_scan = ProjectScan.model_validate(cache_json)
+    loaded_scan = ProjectScan.model_validate_json(cache_file.read_bytes())
 
     # Verify data matches
     assert loaded_scan.project_root == original_scan.project_root
@@ -134,22 +178,8 @@ def test_round_trip_serialization(tmp_path: Path) -> None:
 
 def test_init_command_end_to_end(tmp_path: Path) -> None:
     """Test init_command creates all expected artifacts."""
-    from imp.context.cli import init_command
-
     # Create a Python project with nested structure
-    src_dir = tmp_path / "src"
-    src_dir.mkdir()
-    (src_dir / "main.py").write_text("""
-def main() -> None:
-    print("Hello")
-""")
-
-    tests_dir = tmp_path / "tests"
-    tests_dir.mkdir()
-    (tests_dir / "test_main.py").write_text("""
-def test_main() -> None:
-    assert True
-""")
+    _write_tree(tmp_path, {"src/main.py": _MAIN_PY, "tests/test_main.py": _TEST_MAIN_PY})
 
     # Run init_command
     exit_code = init_command(root=tmp_path, format="human")
@@ -157,81 +187,52 @@ def test_main() -> None:
 
     # Verify all artifacts exist
     assert (tmp_path / ".index.md").exists()
-    assert (src_dir / ".index.md").exists()
-    assert (tests_dir / ".index.md").exists()
+    assert (tmp_path / "src" / ".index.md").exists()
+    assert (tmp_path / "tests" / ".index.md").exists()
     assert (tmp_path / ".imp" / "scan.json").exists()
 
     # Verify cache contains expected data
-    cache = json.loads((tmp_path / ".imp" / "scan.json").read_text())
-    assert cache["total_files"] == 2
-
-
-def test_index_content_accuracy(tmp_path: Path) -> None:
-    """Test that .index.md contains accurate information about code structure."""
-    from imp.context.indexer import generate_indexes
-    from imp.context.parser import scan_and_parse
-
-    # Create a module with known structure
-    (tmp_path / "module.py").write_text("""
-\"\"\"A test module.\"\"\"
-
-class Calculator:
-    \"\"\"A calculator class.\"\"\"
-
-    def add(self, a: int, b: int) -> int:
-        \"\"\"Add two numbers.\"\"\"
-        return a + b
-
-    def subtract(self, a: int, b: int) -> int:
-        \"\"\"Subtract two numbers.\"\"\"
-        return a - b
-
-def standalone_function() -> None:
-    \"\"\"A standalone function.\"\"\"
-    pass
-""")
+    cache = ProjectScan.model_validate_json((tmp_path / ".imp" / "scan.json").read_bytes())
+    assert cache.total_files == 2
+
+
+@pytest.mark.parametrize(
+    ("files", "expected_type", "expected_files"),
+    [
+        pytest.param({}, "unknown", 0, id="empty"),
+        pytest.param({"module.py": _CALCULATOR_PY}, "python", 1, id="python"),
+        pytest.param(
+            {"app.py": b"def main(): pass", "script.ts": b"function hello() {}"},
+            "mixed",
+            2,
+            id="mixed",
+        ),
+    ],
+)
+def test_scan_and_index_shape(
+    tmp_path: Path, files: dict[str, bytes], expected_type: str, expected_files: int
+) -> None:
+    """Test project detection and .index.md content for small single-directory projects.
+
+    The root index is written even for an empty project.
+    """
+    _write_tree(tmp_path, files)
 
     # Scan, parse, and generate indexes
     scan_result = scan_and_parse(tmp_path)
+    assert (scan_result.project_type, scan_result.total_files) == (expected_type, expected_files)
     generate_indexes(scan_result, tmp_path)
 
-    # Read the root index
-    root_index = (tmp_path / ".index.md").read_text()
-
-    # Should have project structure information
-    assert "Project Index" in root_index or "Module" in root_index
-
-    # Read module index (for files in root, it's same as root index conceptually)
-    # The actual implementation creates a module index in the directory with the file
-    # So look for content that indicates the module was indexed
-    assert "1" in root_index  # Should show 1 file or 1 class somewhere
-
-
-def test_mixed_project_detection(tmp_path: Path) -> None:
-    """Test that mixed Python/TypeScript projects are detected correctly."""
-    from imp.context.parser import scan_and_parse
-
-    # Create mixed project
-    (tmp_path / "app.py").write_text("def main(): pass")
-    (tmp_path / "script.ts").write_text("function hello() {}")
-
-    # Scan and parse
-    scan_result = scan_and_parse(tmp_path)
-
-    # Should detect as mixed
-    assert scan_result.project_type == "mixed"
-    assert scan_result.total_files == 2
+    # Root index should have project structure information and the file count
+    root_index = (tmp_path / ".index.md").read_bytes()
+    assert b"Project Index" in root_index or b"Module" in root_index
+    assert str(expected_files).encode() in root_index
 
 
 def test_error_handling_in_pipeline(tmp_path: Path) -> None:
     """Test that pipeline handles parse errors gracefully."""
-    from imp.context.parser import scan_and_parse
-
     # Create a file with syntax error
-    (tmp_path / "bad.py").write_text("""
-def broken(
-    # Missing closing paren and body
-""")
+    _write_tree(tmp_path, {"bad.py": _BAD_PY})
 
     # Should still complete scan (with parse_error set)
     scan_result = scan_and_parse(tmp_path)
@@ -239,16 +240,11 @@ def broken(
     # Should have the file in results
     assert scan_result.total_files == 1
 
-    # Find the module with the bad file
-    for dir_mod in scan_result.modules:
-        for mod_info in dir_mod.files:
-            if "bad.py" in mod_info.file_info.path:
-                # Should have parse_error set
-                assert mod_info.parse_error is not None
-                assert (
-                    "SyntaxError" in mod_info.parse_error
-                    or "IndentationError" in mod_info.parse_error
-                )
+    # Find the bad file in a flat path index; it must be present and carry parse_error
+    by_path = {m.file_info.path: m for d in scan_result.modules for m in d.files}
+    bad = next(m for path, m in by_path.items() if path.endswith("bad.py"))
+    assert bad.parse_error is not None
+    assert "SyntaxError" in bad.parse_error or "IndentationError" in bad.parse_error
 
 
 # ===== L3 Integration Tests =====
@@ -256,84 +252,34 @@ def broken(
 
 def test_full_pipeline_with_summarization(tmp_path: Path) -> None:
     """Test full L1+L2+L3 pipeline with mock AI summarization."""
-    from unittest.mock import AsyncMock
-
-    from imp.context.cli import init_command
-    from imp.types import TokenUsage
-
     # Create a multi-module project
-    src_dir = tmp_path / "src"
-    src_dir.mkdir()
-    (src_dir / "core.py").write_text("""
-def process() -> None:
-    \"\"\"Process data.\"\"\"
-    pass
-
-class Processor:
-    \"\"\"Main processor.\"\"\"
-    def run(self) -> None:
-        pass
-""")
-
-    tests_dir = tmp_path / "tests"
-    tests_dir.mkdir()
-    (tests_dir / "test_core.py").write_text("""
-def test_process() -> None:
-    assert True
-""")
-
-    mock_invoke = AsyncMock(
-        side_effect=lambda prompt: (
-            f"Module at {prompt.split('`')[1]} handles core logic.",
-            TokenUsage(input_tokens=100, output_tokens=20, total_tokens=120),
-        )
-    )
+    _write_tree(tmp_path, {"src/core.py": _PROCESSOR_PY, "tests/test_core.py": _TEST_CORE_PY})
 
     # Run with summarization
-    exit_code = init_command(
-        root=tmp_path,
-        format="human",
-        summarize=True,
-        model="test-model",
-        invoke_fn=mock_invoke,
-    )
-    assert exit_code == 0
+    _run_init(tmp_path, _fake_invoke, "test-model")
 
     # Verify .index.md has purpose descriptions
-    root_index = (tmp_path / ".index.md").read_text()
-    assert "handles core logic" in root_index
+    root_index = (tmp_path / ".index.md").read_bytes()
+    assert b"handles core logic" in root_index
 
     # Verify summaries cache exists
     summaries_path = tmp_path / ".imp" / "summaries.json"
     assert summaries_path.exists()
-    summaries = json.loads(summaries_path.read_text())
-    assert len(summaries) >= 2  # src/ and tests/
+    assert len(load_summaries(tmp_path)) >= 2  # src/ and tests/
 
 
 def test_staleness_detection_across_reruns(tmp_path: Path) -> None:
     """Test that staleness detection works across re-runs."""
-    from imp.context.cli import init_command
-    from imp.context.staleness import detect_stale_modules, load_previous_scan
-
     # Create initial project
-    src_dir = tmp_path / "src"
-    src_dir.mkdir()
-    (src_dir / "main.py").write_text("def hello(): pass")
-
-    # First run
-    exit_code = init_command(root=tmp_path, format="human")
-    assert exit_code == 0
+    _write_tree(tmp_path, {"src/main.py": b"def hello(): pass"})
 
-    # Load the cached scan
-    previous = load_previous_scan(tmp_path)
-    assert previous is not None
+    # First run; its scan is what the cache now holds
+    previous, *_ = _run_init(tmp_path)
 
     # Add a new file
-    (src_dir / "utils.py").write_text("def helper(): pass")
+    _write_tree(tmp_path, {"src/utils.py": b"def helper(): pass"})
 
     # Re-scan
-    from imp.context.parser import scan_and_parse
-
     current = scan_and_parse(tmp_path)
 
     # Detect staleness
@@ -346,51 +292,33 @@ def test_staleness_detection_across_reruns(tmp_path: Path) -> None:
     assert src_stale[0].reason == "files_added"
 
 
-def test_summary_cache_persistence_across_reruns(tmp_path: Path) -> None:
+def test_summary_cache_persistence_across_reruns(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test that cached summaries persist and are reused across re-runs."""
-    from unittest.mock import AsyncMock
-
-    from imp.context.cli import init_command
-    from imp.context.summary_cache import load_summaries
-    from imp.types import TokenUsage
-
     # Create project
-    src_dir = tmp_path / "src"
-    src_dir.mkdir()
-    (src_dir / "app.py").write_text("class App: pass")
+    _write_tree(tmp_path, {"src/app.py": b"class App: pass"})
+
+    prompts: list[str] = []
 
-    mock_invoke = AsyncMock(
-        return_value=(
-            "Application module.",
-            TokenUsage(input_tokens=50, output_tokens=10, total_tokens=60),
-        )
-    )
+    async def counting_invoke(prompt: str) -> tuple[str, TokenUsage]:
+        prompts.append(prompt)
+        return await _fake_invoke(prompt)
 
     # First run with summarization
-    exit_code = init_command(
-        root=tmp_path,
-        format="human",
-        summarize=True,
-        model="test-model",
-        invoke_fn=mock_invoke,
-    )
-    assert exit_code == 0
-    first_call_count = mock_invoke.call_count
+    cached_scan, *_ = _run_init(tmp_path, counting_invoke, "test-model")
+    first_call_count = len(prompts)
 
     # Load cached summaries
     cached = load_summaries(tmp_path)
     assert len(cached) > 0
 
-    # Second run — should reuse cache
-    mock_invoke.reset_mock()
-    exit_code = init_command(
-        root=tmp_path,
-        format="human",
-        summarize=True,
-        model="test-model",
-        invoke_fn=mock_invoke,
-    )
-    assert exit_code == 0
+    # Second run — sources are unchanged, so reuse the cached scan instead of
+    # re-parsing and exercise only the summary cache
+    monkeypatch.setattr(context_cli, "scan_and_parse", lambda root: cached_scan)
+    prompts.clear()
+    _run_init(tmp_path, counting_invoke, "test-model")
 
-    # Should have fewer AI calls (all cached)
-    assert mock_invoke.call_count < first_call_count
+    # Should make no AI calls (all cached)
+    assert first_call_count > 0
+    assert prompts == []
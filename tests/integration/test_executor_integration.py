@@ -13,8 +13,12 @@ from __future__ import annotations
 import json
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 from imp.executor.context import ContextGenerator
+from imp.executor.io import read_model, write_model
 from imp.executor.logger import DecisionLogger
 from imp.executor.models import (
     CleanResult,
@@ -31,83 +35,63 @@ from imp.executor.session import SessionStore
 class TestSessionLifecycle:
     """Integration tests for SessionStore with real filesystem."""
 
-    def test_create_save_load_round_trip(self, tmp_path: Path) -> None:
-        """Save a session and load it back — all fields should survive."""
-        store = SessionStore(tmp_path)
-        session = WorktreeSession(
-            ticket_id="IMP-100",
-            title="Test session lifecycle",
-            description="Full round-trip test",
-        )
-        store.save(session)
+    @pytest.mark.parametrize(
+        "update",
+        [
+            pytest.param({}, id="create"),
+            pytest.param({"title": "Updated"}, id="overwrite"),
+            pytest.param({"status": SessionStatus.done}, id="transition"),
+        ],
+    )
+    def test_save_load_round_trip(self, tmp_path: Path, update: dict[str, Any]) -> None:
+        """Save a session, optionally mutate and re-save it, and load it back intact."""
+        with SessionStore(tmp_path) as store:
+            session = WorktreeSession(
+                ticket_id="IMP-100",
+                title="Test session lifecycle",
+                description="Full round-trip test",
+            )
+            store.save(session)
+            for field, value in update.items():
+                setattr(session, field, value)
+            if update:
+                store.save(session)
 
-        loaded = store.load("IMP-100")
-        assert loaded is not None
-        assert loaded.ticket_id == "IMP-100"
-        assert loaded.title == "Test session lifecycle"
-        assert loaded.description == "Full round-trip test"
-        assert loaded.status == SessionStatus.active
-        assert loaded.branch == "imp/IMP-100"
-        assert loaded.worktree_path == ".trees/IMP-100"
+            loaded = store.load("IMP-100")
+            assert loaded is not None
+            assert loaded == session
+            assert (loaded.branch, loaded.worktree_path) == ("imp/IMP-100", ".trees/IMP-100")
+            assert len(store.list_sessions()) == 1
 
     def test_multiple_sessions_list(self, tmp_path: Path) -> None:
         """Save multiple sessions and list them all."""
-        store = SessionStore(tmp_path)
-        for i in range(5):
-            session = WorktreeSession(
-                ticket_id=f"IMP-{i}",
-                title=f"Session {i}",
+        with SessionStore(tmp_path) as store:
+            store.save_many(
+                WorktreeSession(ticket_id=f"IMP-{i}", title=f"Session {i}") for i in range(5)
             )
-            store.save(session)
 
-        sessions = store.list_sessions()
-        assert len(sessions) == 5
-        ids = {s.ticket_id for s in sessions}
-        assert ids == {"IMP-0", "IMP-1", "IMP-2", "IMP-3", "IMP-4"}
+            sessions = store.list_sessions()
+            assert len(sessions) == 5
+            ids = {s.ticket_id for s in sessions}
+            assert ids == {"IMP-0", "IMP-1", "IMP-2", "IMP-3", "IMP-4"}
+            assert set(store.list_ticket_ids()) == ids
 
     def test_delete_removes_session(self, tmp_path: Path) -> None:
-        """Delete should remove the JSON file."""
-        store = SessionStore(tmp_path)
-        session = WorktreeSession(ticket_id="IMP-DEL", title="To delete")
-        store.save(session)
-        assert store.exists("IMP-DEL")
-
-        deleted = store.delete("IMP-DEL")
-        assert deleted is True
-        assert store.exists("IMP-DEL") is False
-        assert store.load("IMP-DEL") is None
-
-    def test_status_transition_persists(self, tmp_path: Path) -> None:
-        """Mutating status and re-saving should persist the change."""
-        store = SessionStore(tmp_path)
-        session = WorktreeSession(ticket_id="IMP-STAT", title="Status test")
-        store.save(session)
-
-        # Transition to done
-        session.status = SessionStatus.done
-        store.save(session)
-
-        loaded = store.load("IMP-STAT")
-        assert loaded is not None
-        assert loaded.status == SessionStatus.done
-
-    def test_overwrite_existing_session(self, tmp_path: Path) -> None:
-        """Re-saving with same ticket_id overwrites."""
-        store = SessionStore(tmp_path)
-        session = WorktreeSession(ticket_id="IMP-OW", title="Original")
-        store.save(session)
-
-        session.title = "Updated"
-        store.save(session)
+        """Delete should remove the stored session."""
+        with SessionStore(tmp_path) as store:
+            session = WorktreeSession(ticket_id="IMP-DEL", title="To delete")
+            store.save(session)
+            assert store.exists("IMP-DEL")
 
-        loaded = store.load("IMP-OW")
-        assert loaded is not None
-        assert loaded.title == "Updated"
+            deleted = store.delete("IMP-DEL")
+            assert deleted is True
+            assert store.exists("IMP-DEL") is False
+            assert store.load("IMP-DEL") is None
 
     def test_empty_store_returns_empty_list(self, tmp_path: Path) -> None:
-        """No sessions directory → empty list."""
-        store = SessionStore(tmp_path)
-        assert store.list_sessions() == []
+        """No sessions database → empty list."""
+        with SessionStore(tmp_path) as store:
+            assert store.list_sessions() == []
 
 
 class TestContextGeneratorIntegration:
@@ -251,90 +235,91 @@ class TestEndToEndWorkflow:
     def test_session_to_task_to_decision(self, tmp_path: Path) -> None:
         """Full flow: create session → generate TASK.md → log decision."""
         # 1. Create and save session
-        store = SessionStore(tmp_path)
-        session = WorktreeSession(
-            ticket_id="IMP-E2E",
-            title="End-to-end test",
-            description="Verify full workflow",
-        )
-        store.save(session)
+        with SessionStore(tmp_path) as store:
+            session = WorktreeSession(
+                ticket_id="IMP-E2E",
+                title="End-to-end test",
+                description="Verify full workflow",
+            )
+            store.save(session)
 
-        # 2. Generate TASK.md
-        ctx_gen = ContextGenerator(tmp_path)
-        content = ctx_gen.generate(session)
-        worktree = tmp_path / ".trees" / "IMP-E2E"
-        worktree.mkdir(parents=True)
-        ctx_gen.write_task_file(worktree, content)
-        assert (worktree / "TASK.md").exists()
+            # 2. Generate TASK.md
+            ctx_gen = ContextGenerator(tmp_path)
+            content = ctx_gen.generate(session)
+            worktree = tmp_path / ".trees" / "IMP-E2E"
+            worktree.mkdir(parents=True)
+            ctx_gen.write_task_file(worktree, content)
+            assert (worktree / "TASK.md").exists()
 
-        # 3. Mark done + log decision
-        session.status = SessionStatus.done
-        store.save(session)
+            # 3. Mark done + log decision
+            session.status = SessionStatus.done
+            store.save(session)
 
-        logger = DecisionLogger(tmp_path)
-        attempts = [
-            CompletionAttempt(
-                attempt_number=1,
-                check_passed=True,
-                check_output="ok",
-                review_passed=True,
-                review_output="clean",
-                timestamp=datetime.now(UTC),
+            logger = DecisionLogger(tmp_path)
+            attempts = [
+                CompletionAttempt(
+                    attempt_number=1,
+                    check_passed=True,
+                    check_output="ok",
+                    review_passed=True,
+                    review_output="clean",
+                    timestamp=datetime.now(UTC),
+                )
+            ]
+            entry = logger.log_completion(
+                ticket_id="IMP-E2E",
+                attempts=attempts,
+                outcome="done",
+                worktree_path=worktree,
             )
-        ]
-        entry = logger.log_completion(
-            ticket_id="IMP-E2E",
-            attempts=attempts,
-            outcome="done",
-            worktree_path=worktree,
-        )
 
-        # Verify everything is on disk
-        loaded_session = store.load("IMP-E2E")
-        assert loaded_session is not None
-        assert loaded_session.status == SessionStatus.done
-        assert entry.outcome == "done"
+            # Verify everything is on disk
+            loaded_session = store.load("IMP-E2E")
+            assert loaded_session is not None
+            assert loaded_session.status == SessionStatus.done
+            assert entry.outcome == "done"
 
     def test_escalation_flow(self, tmp_path: Path) -> None:
         """Test escalation: 3 failed checks → escalated status."""
-        store = SessionStore(tmp_path)
-        session = WorktreeSession(
-            ticket_id="IMP-ESC",
-            title="Escalation test",
-        )
-        store.save(session)
-
-        # Simulate 3 failed check attempts
-        attempts = [
-            CompletionAttempt(
-                attempt_number=i + 1,
-                check_passed=False,
-                check_output=f"failed attempt {i + 1}",
-                timestamp=datetime.now(UTC),
+        with SessionStore(tmp_path) as store:
+            session = WorktreeSession(
+                ticket_id="IMP-ESC",
+                title="Escalation test",
             )
-            for i in range(3)
-        ]
+            store.save(session)
 
-        # Mark escalated
-        session.status = SessionStatus.escalated
-        store.save(session)
+            # Simulate 3 failed check attempts, stamped with one shared timestamp
+            now = datetime.now(UTC)
+            attempts = [
+                CompletionAttempt(
+                    attempt_number=i + 1,
+                    check_passed=False,
+                    check_output=f"failed attempt {i + 1}",
+                    timestamp=now,
+                )
+                for i in range(3)
+            ]
 
-        # Log decision
-        logger = DecisionLogger(tmp_path)
-        wt = tmp_path / ".trees" / "IMP-ESC"
-        wt.mkdir(parents=True)
-        entry = logger.log_completion(
-            ticket_id="IMP-ESC",
-            attempts=attempts,
-            outcome="escalated",
-            worktree_path=wt,
-        )
+            # Mark escalated
+            session.status = SessionStatus.escalated
+            store.save(session)
 
-        assert entry.outcome == "escalated"
-        assert len(entry.attempt_history) == 3
-        loaded = store.load("IMP-ESC")
-        assert loaded is not None
-        assert loaded.status == SessionStatus.escalated
+            # Log decision
+            logger = DecisionLogger(tmp_path)
+            wt = tmp_path / ".trees" / "IMP-ESC"
+            wt.mkdir(parents=True)
+            entry = logger.log_completion(
+                ticket_id="IMP-ESC",
+                attempts=attempts,
+                outcome="escalated",
+                worktree_path=wt,
+            )
+
+            assert entry.outcome == "escalated"
+            assert len(entry.attempt_history) == 3
+            loaded = store.load("IMP-ESC")
+            assert loaded is not None
+            assert loaded.status == SessionStatus.escalated
 
 
 class TestModelSerializationIntegration:
@@ -348,9 +333,9 @@ class TestModelSerializationIntegration:
             description="Testing serialization",
         )
         path = tmp_path / "session.json"
-        path.write_text(session.model_dump_json(indent=2))
+        write_model(path, session)
 
-        loaded = WorktreeSession.model_validate_json(path.read_text())
+        loaded = read_model(WorktreeSession, path)
         assert loaded.ticket_id == session.ticket_id
         assert loaded.title == session.title
         assert loaded.branch == "imp/IMP-JSON"
@@ -375,9 +360,9 @@ class TestModelSerializationIntegration:
             pm_updated=False,
         )
         path = tmp_path / "result.json"
-        path.write_text(result.model_dump_json(indent=2))
+        write_model(path, result)
 
-        loaded = CompletionResult.model_validate_json(path.read_text())
+        loaded = read_model(CompletionResult, path)
         assert loaded.ticket_id == "IMP-CR"
         assert loaded.passed is True
         assert loaded.committed is True
@@ -392,11 +377,11 @@ class TestModelSerializationIntegration:
             pruned_branches=["imp/IMP-1", "imp/IMP-2"],
         )
         path = tmp_path / "clean.json"
-        path.write_text(clean.model_dump_json())
+        write_model(path, clean, indent=None)
 
-        loaded = CleanResult.model_validate_json(path.read_text())
-        assert loaded.removed_sessions == ["IMP-1", "IMP-2"]
-        assert loaded.skipped_sessions == ["IMP-3"]
+        loaded = read_model(CleanResult, path)
+        assert loaded.removed_sessions == ("IMP-1", "IMP-2")
+        assert loaded.skipped_sessions == ("IMP-3",)
 
     def test_session_list_entry_from_session(self, tmp_path: Path) -> None:
         """SessionListEntry can be derived from WorktreeSession fields."""
@@ -177,26 +177,25 @@ def test_session_store() -> bool:
 
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
-            store = SessionStore(root)
-
-            # Save
-            session = WorktreeSession(ticket_id="SS-1", title="Store test")
-            store.save(session)
-            assert store.exists("SS-1")
-
-            # Load
-            loaded = store.load("SS-1")
-            assert loaded is not None
-            assert loaded.ticket_id == "SS-1"
-
-            # List
-            sessions = store.list_sessions()
-            assert len(sessions) == 1
-
-            # Delete
-            assert store.delete("SS-1") is True
-            assert store.exists("SS-1") is False
-            assert store.delete("SS-1") is False
+            with SessionStore(root) as store:
+                # Save
+                session = WorktreeSession(ticket_id="SS-1", title="Store test")
+                store.save(session)
+                assert store.exists("SS-1")
+
+                # Load
+                loaded = store.load("SS-1")
+                assert loaded is not None
+                assert loaded.ticket_id == "SS-1"
+
+                # List
+                sessions = store.list_sessions()
+                assert len(sessions) == 1
+
+                # Delete
+                assert store.delete("SS-1") is True
+                assert store.exists("SS-1") is False
+                assert store.delete("SS-1") is False
 
         print("  SessionStore works correctly")
         return True